@@ -4,11 +4,13 @@ import math
 from abc import abstractmethod
 from copy import deepcopy
 from enum import Enum
-from typing import Callable, List, Optional, Tuple, Union
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Tuple, Union, overload
 
 import numpy as np
+import numpy.typing as npt
 
-from bushfire_drone_simulation.fire_utils import Base, Location, WaterTank
+from bushfire_drone_simulation.fire_utils import Base, Location, WaterTank, closest_location_index
+from bushfire_drone_simulation.kernels import haversine_distance
 from bushfire_drone_simulation.lightning import Lightning
 from bushfire_drone_simulation.linked_list import LinkedList
 from bushfire_drone_simulation.precomputed import PreComputedDistances
@@ -33,6 +35,12 @@ class Status(Enum):
     UNASSIGNED = "Unassigned"
 
 
+_STATUSES: List[Status] = list(Status)
+_STATUS_CODES: Dict[Status, int] = {status: code for code, status in enumerate(_STATUSES)}
+# Status codes of updates after which the distance travelled is hovering
+_HOVERING_STATUS_CODES = (_STATUS_CODES[Status.HOVERING], _STATUS_CODES[Status.INSPECTING_STRIKE])
+
+
 class UpdateEvent(Location):  # pylint: disable=too-few-public-methods
     """Class keeping track of all updates to an Aircrafts position."""
 
@@ -85,6 +93,202 @@ class UpdateEvent(Location):  # pylint: disable=too-few-public-methods
         return self.time < other.time
 
 
+class PastLocations:
+    """Columnar store of the UpdateEvents of an aircraft.
+
+    The numerical fields of each update are stored in contiguous NumPy arrays (grown by doubling
+    when full) rather than as individual UpdateEvent objects, so they take less memory and can be
+    analysed without iterating in Python. Statuses are stored as int8 codes (see status_code).
+    UpdateEvents are only constructed when accessed.
+    """
+
+    _LAT, _LON, _TIME, _DISTANCE_TRAVELLED, _FUEL, _RANGE, _DISTANCE_HOVERED, _WATER = range(8)
+
+    def __init__(self, updates: Iterable[UpdateEvent] = (), initial_capacity: int = 16):
+        """Initialize past locations, optionally from an iterable of existing updates."""
+        self._length = 0
+        self._numeric: npt.NDArray[np.float64] = np.empty((8, max(initial_capacity, 1)))
+        self._status_codes: npt.NDArray[np.int8] = np.empty(max(initial_capacity, 1), np.int8)
+        self._names: List[str] = []
+        self._next_events: List[List[str]] = []
+        self._loc_id_nos: List[Optional[int]] = []
+        for update in updates:
+            self.append(update)
+
+    def add(  # pylint: disable=too-many-arguments
+        self,
+        name: str,
+        latitude: float,
+        longitude: float,
+        time: float,
+        status: Status,
+        distance_travelled: float,
+        current_fuel: float,
+        current_range: float,
+        distance_hovered: float,
+        current_water: float,
+        list_of_next_events: List[str],
+        loc_id_no: Optional[int] = None,
+    ) -> None:
+        """Add an update without constructing an UpdateEvent. Arguments match UpdateEvent."""
+        if self._length == self._numeric.shape[1]:
+            self._numeric = np.concatenate((self._numeric, np.empty_like(self._numeric)), axis=1)
+            self._status_codes = np.concatenate(
+                (self._status_codes, np.empty_like(self._status_codes))
+            )
+        self._numeric[:, self._length] = (
+            latitude,
+            longitude,
+            time,
+            distance_travelled,
+            current_fuel,
+            current_range,
+            distance_hovered,
+            current_water,
+        )
+        self._status_codes[self._length] = _STATUS_CODES[status]
+        self._names.append(name)
+        self._next_events.append(list_of_next_events)
+        self._loc_id_nos.append(loc_id_no)
+        self._length += 1
+
+    def append(self, update: UpdateEvent) -> None:
+        """Append an UpdateEvent."""
+        self.add(
+            update.name,
+            update.lat,
+            update.lon,
+            update.time,
+            update.status,
+            update.distance_travelled,
+            update.fuel,
+            update.current_range,
+            update.distance_hovered,
+            update.water,
+            update.list_of_next_events,
+            update.loc_id_no,
+        )
+
+    @classmethod
+    def _from_buffers(
+        cls,
+        numeric: npt.NDArray[np.float64],
+        status_codes: npt.NDArray[np.int8],
+        names: List[str],
+        next_events: List[List[str]],
+        loc_id_nos: List[Optional[int]],
+    ) -> "PastLocations":
+        """Construct past locations that take ownership of the given (full) buffers."""
+        past_locations = cls(initial_capacity=0)
+        past_locations._numeric = numeric
+        past_locations._status_codes = status_codes
+        past_locations._names = names
+        past_locations._next_events = next_events
+        past_locations._loc_id_nos = loc_id_nos
+        past_locations._length = len(names)
+        return past_locations
+
+    def copy(self) -> "PastLocations":
+        """Return a copy of past locations that does not share storage with the original."""
+        return self._from_buffers(
+            self._numeric[:, : self._length].copy(),
+            self._status_codes[: self._length].copy(),
+            list(self._names),
+            list(self._next_events),
+            list(self._loc_id_nos),
+        )
+
+    def _column(self, field: int) -> npt.NDArray[np.float64]:
+        """Return a view of a numerical column (only valid until the next update is added)."""
+        return self._numeric[field, : self._length]
+
+    @property
+    def times(self) -> npt.NDArray[np.float64]:
+        """Times of each update."""
+        return self._column(self._TIME)
+
+    @property
+    def lats(self) -> npt.NDArray[np.float64]:
+        """Latitudes of each update."""
+        return self._column(self._LAT)
+
+    @property
+    def lons(self) -> npt.NDArray[np.float64]:
+        """Longitudes of each update."""
+        return self._column(self._LON)
+
+    @property
+    def status_codes(self) -> npt.NDArray[np.int8]:
+        """Status codes of each update (only valid until the next update is added)."""
+        return self._status_codes[: self._length]
+
+    @staticmethod
+    def status_code(status: Status) -> int:
+        """Return the code representing a given status in status_codes."""
+        return _STATUS_CODES[status]
+
+    def _index(self, idx: int) -> int:
+        """Convert a possibly negative index into a non-negative one."""
+        if idx < 0:
+            idx += self._length
+        if not 0 <= idx < self._length:
+            raise IndexError("past locations index out of range")
+        return idx
+
+    def _update_event(self, idx: int) -> UpdateEvent:
+        """Construct the UpdateEvent at a given (non-negative) index."""
+        lat, lon, time, travelled, fuel, current_range, hovered, water = self._numeric[
+            :, idx
+        ].tolist()
+        return UpdateEvent(
+            self._names[idx],
+            lat,
+            lon,
+            time,
+            _STATUSES[self._status_codes[idx]],
+            travelled,
+            fuel,
+            current_range,
+            hovered,
+            water,
+            self._next_events[idx],
+            loc_id_no=self._loc_id_nos[idx],
+        )
+
+    @overload
+    def __getitem__(self, idx: int) -> UpdateEvent:
+        ...
+
+    @overload
+    def __getitem__(self, idx: slice) -> List[UpdateEvent]:
+        ...
+
+    def __getitem__(self, idx: Union[int, slice]) -> Union[UpdateEvent, List[UpdateEvent]]:
+        """Return the UpdateEvent at an index or a list of UpdateEvents for a slice."""
+        if isinstance(idx, slice):
+            return [self._update_event(i) for i in range(*idx.indices(self._length))]
+        return self._update_event(self._index(idx))
+
+    def __delitem__(self, idx: int) -> None:
+        """Delete the update at a given index."""
+        idx = self._index(idx)
+        self._numeric[:, idx : self._length - 1] = self._numeric[:, idx + 1 : self._length]
+        self._status_codes[idx : self._length - 1] = self._status_codes[idx + 1 : self._length]
+        del self._names[idx]
+        del self._next_events[idx]
+        del self._loc_id_nos[idx]
+        self._length -= 1
+
+    def __len__(self) -> int:
+        """Return number of updates."""
+        return self._length
+
+    def __iter__(self) -> Iterator[UpdateEvent]:
+        """Iterate over updates."""
+        for idx in range(self._length):
+            yield self._update_event(idx)
+
+
 class Event:  # pylint: disable=too-few-public-methods
     """Class containing events."""
 
@@ -129,6 +333,55 @@ class AircraftType(Enum):
 class Aircraft(Location):  # pylint: disable=too-many-public-methods
     """Generic aircraft class for flying vehicles."""
 
+    # Location does not define __slots__, so lat and lon remain in the instance __dict__
+    __slots__ = (
+        "flight_speed",
+        "fuel_refill_time",
+        "time",
+        "id_no",
+        "current_fuel_capacity",
+        "status",
+        "past_locations",
+        "strikes_visited",
+        "event_queue",
+        "use_current_status",
+        "closest_base",
+        "required_departure_time",
+        "precomputed",
+        "fuel_tank_capacity",
+        "unassigned_target",
+        "pct_fuel_cutoff",
+        "unassigned_dt",
+    )
+
+    # Aircraft that do not carry water have none (WaterBomber overrides these per instance)
+    water_on_board: float = 0.0
+    water_capacity: float = 0.0
+    water_per_suppression: float = 0.0
+    water_refill_time: float = 0.0
+
+    # Attributes copied by copy_from_aircraft (past_locations and strikes_visited are copied
+    # separately so they are not shared between the aircraft)
+    _COPY_ATTRS: Tuple[str, ...] = (
+        "lat",
+        "lon",
+        "flight_speed",
+        "fuel_refill_time",
+        "time",
+        "id_no",
+        "current_fuel_capacity",
+        "status",
+        "event_queue",
+        "use_current_status",
+        "closest_base",
+        "required_departure_time",
+        "precomputed",
+        "fuel_tank_capacity",
+        "unassigned_target",
+        "pct_fuel_cutoff",
+        "unassigned_dt",
+    )
+
     def __init__(
         self,
         latitude: float,
@@ -151,7 +404,7 @@ class Aircraft(Location):  # pylint: disable=too-many-public-methods
             self.status = Status.WAITING_AT_BASE
         else:
             self.status = Status.HOVERING
-        self.past_locations: List[UpdateEvent] = []
+        self.past_locations = PastLocations()
         self.strikes_visited: List[Tuple[Lightning, float]] = []
         self.event_queue: LinkedList[Event] = LinkedList()
         self.use_current_status: bool = False
@@ -169,7 +422,10 @@ class Aircraft(Location):  # pylint: disable=too-many-public-methods
         Args:
             other ("Aircraft"): other
         """
-        self.__dict__.update(other.__dict__)
+        for attribute in self._COPY_ATTRS:
+            setattr(self, attribute, getattr(other, attribute))
+        self.past_locations = other.past_locations.copy()
+        self.strikes_visited = list(other.strikes_visited)
 
     def accept_precomputed_distances(self, precomputed: PreComputedDistances) -> None:
         """Accept precomputed distance class with distances already evaluated."""
@@ -221,7 +477,7 @@ class Aircraft(Location):  # pylint: disable=too-many-public-methods
     def _get_future_water(self) -> float:
         """Return water on board as if all elements of the event queue have been completed."""
         if self.event_queue.is_empty() or self.use_current_status:
-            return self._get_water_on_board()
+            return self.water_on_board
         return self.event_queue.peak_last().water
 
     def _get_future_status(self) -> Status:
@@ -230,32 +486,6 @@ class Aircraft(Location):  # pylint: disable=too-many-public-methods
             return self.status
         return self.event_queue.peak_last().completion_status
 
-    def _get_water_per_suppression(self) -> float:
-        """Return water per delivery time of Aircraft."""
-        assert (
-            self.aircraft_type() == AircraftType.WB
-        ), f"{self.get_name()} is trying to measure water per delivery"
-        return 0
-
-    def _get_water_capacity(self) -> float:
-        """Return water capacity of Aircraft."""
-        assert (
-            self.aircraft_type() == AircraftType.WB
-        ), f"{self.get_name()} is trying to measure it's water capacity"
-        return 0
-
-    def _get_water_refill_time(self) -> float:
-        """Return water refill time of Aircraft."""
-        assert (
-            self.aircraft_type() == AircraftType.WB
-        ), f"{self.get_name()} is trying to visit a water tank"
-        return 0
-
-    # pylint: disable=R0201
-    def _get_water_on_board(self) -> float:
-        """Return water on board of Aircraft."""
-        return 0
-
     def _set_water_on_board(self, water: float) -> None:  # pylint: disable=unused-argument
         """Set water on board of Aircraft."""
         assert (
@@ -294,7 +524,7 @@ class Aircraft(Location):  # pylint: disable=too-many-public-methods
             id_no = event.position.id_no
         self.status = event.departure_status
         self._add_update(id_no)
-        if abs(self.time - self.past_locations[-2].time) < EPSILON:
+        if abs(self.time - self.past_locations.times[-2]) < EPSILON:
             del self.past_locations[-2]
         self.status = event.arrival_status
         self.current_fuel_capacity = event.arrival_fuel
@@ -307,7 +537,7 @@ class Aircraft(Location):  # pylint: disable=too-many-public-methods
             assert (
                 self.aircraft_type() == AircraftType.WB
             ), f"{self.get_name()} was sent to a water tank"
-            event.position.remove_water(self._get_water_capacity() - self._get_water_on_board())
+            event.position.remove_water(self.water_capacity - self.water_on_board)
         elif isinstance(event.position, Lightning):
             if self.aircraft_type() == AircraftType.UAV:
                 event.position.inspected(self.time)
@@ -370,7 +600,7 @@ class Aircraft(Location):  # pylint: disable=too-many-public-methods
                         self._add_update(next_event.position.id_no)
                     else:
                         self._add_update()
-                    if abs(self.time - self.past_locations[-2].time) < EPSILON:
+                    if abs(self.time - self.past_locations.times[-2]) < EPSILON:
                         del self.past_locations[-2]
 
                     # update to midpoint
@@ -446,11 +676,11 @@ class Aircraft(Location):  # pylint: disable=too-many-public-methods
             #         if isinstance(event.position, WaterTank):
             #             if prev_event is None:
             #                 event.position.return_allocated_water(
-            #                     self._get_water_capacity() - self._get_water_on_board()
+            #                     self.water_capacity - self.water_on_board
             #                 )
             #             else:
             #                 event.position.return_allocated_water(
-            #                     self._get_water_capacity() - prev_event.value.water
+            #                     self.water_capacity - prev_event.value.water
             #                 )
             self.event_queue.clear()
             self.use_current_status = False
@@ -464,9 +694,9 @@ class Aircraft(Location):  # pylint: disable=too-many-public-methods
 
         if isinstance(position, WaterTank):
             assert self.aircraft_type() == AircraftType.WB, "A UAV was sent to a water tank"
-            event_completion_time = event_arrival_time + self._get_water_refill_time()
-            position.remove_unallocated_water(self._get_water_capacity() - self._get_future_water())
-            water = self._get_water_capacity()
+            event_completion_time = event_arrival_time + self.water_refill_time
+            position.remove_unallocated_water(self.water_capacity - self._get_future_water())
+            water = self.water_capacity
             self.event_queue.put(
                 Event(
                     position=position,
@@ -506,7 +736,7 @@ class Aircraft(Location):  # pylint: disable=too-many-public-methods
                 arrival_fuel - self._get_time_at_strike() * self.flight_speed / self.get_range()
             )
             if self.aircraft_type() == AircraftType.WB:
-                water -= self._get_water_per_suppression()
+                water -= self.water_per_suppression
                 if water < 0:
                     _LOG.error("%s ran out of water.", self.get_name())
             self.event_queue.put(
@@ -566,7 +796,7 @@ class Aircraft(Location):  # pylint: disable=too-many-public-methods
             departure_time (Time): time of triggering event of consider going to base
         """
         if self._get_future_status() in [Status.HOVERING, Status.UNASSIGNED]:
-            base_index = int(np.argmin(list(map(self._get_future_position().distance, bases))))
+            base_index = closest_location_index(self._get_future_position(), bases)
             dist_to_base = self._get_future_position().distance(bases[base_index])
             extra_fuel = self._get_future_fuel() - dist_to_base / (
                 self.get_range() * self.pct_fuel_cutoff
@@ -580,6 +810,33 @@ class Aircraft(Location):  # pylint: disable=too-many-public-methods
             self.closest_base = None
             self.required_departure_time = None
 
+    def _leg_distance(  # pylint: disable=too-many-return-statements
+        self, departure_pos: Location, position: Location
+    ) -> float:
+        """Return the distance between two positions of a route, precomputed where possible."""
+        precomputed = self.precomputed
+        if precomputed is None:
+            return departure_pos.distance(position)
+        if self.aircraft_type() == AircraftType.WB:
+            if isinstance(position, Base) and isinstance(departure_pos, Lightning):
+                return precomputed.ignition_to_base(departure_pos, position, self.get_type())
+            if isinstance(position, Lightning) and isinstance(departure_pos, Base):
+                return precomputed.ignition_to_base(position, departure_pos, self.get_type())
+            if isinstance(position, Base) and isinstance(departure_pos, WaterTank):
+                return precomputed.water_to_base(departure_pos, position, self.get_type())
+            if isinstance(position, WaterTank) and isinstance(departure_pos, Base):
+                return precomputed.water_to_base(position, departure_pos, self.get_type())
+            if isinstance(position, Lightning) and isinstance(departure_pos, WaterTank):
+                return precomputed.ignition_to_water(position, departure_pos)
+            if isinstance(position, WaterTank) and isinstance(departure_pos, Lightning):
+                return precomputed.ignition_to_water(departure_pos, position)
+        else:
+            if isinstance(position, Base) and isinstance(departure_pos, Lightning):
+                return precomputed.uav_dist(departure_pos, position)
+            if isinstance(position, Lightning) and isinstance(departure_pos, Base):
+                return precomputed.uav_dist(position, departure_pos)
+        return departure_pos.distance(position)
+
     def enough_fuel(  # pylint: disable=too-many-branches, too-many-arguments
         self,
         positions: List[Location],
@@ -613,48 +870,13 @@ class Aircraft(Location):  # pylint: disable=too-many-public-methods
             current_time = state.completion_time
             current_fuel = state.completion_fuel
             current_pos = state.position
+        departure_pos = current_pos
         for idx, position in enumerate(positions):
             if idx == 0:
-                dist = current_pos.distance(position)
+                # The first leg departs from an arbitrary position so is never precomputed
+                dist = departure_pos.distance(position)
             else:
-                departure_pos = positions[idx - 1]
-                if self.precomputed is not None:
-                    if self.aircraft_type() == AircraftType.WB:
-                        if isinstance(position, Base) and isinstance(departure_pos, Lightning):
-                            dist = self.precomputed.ignition_to_base(
-                                departure_pos, position, self.get_type()
-                            )
-                        elif isinstance(position, Lightning) and isinstance(departure_pos, Base):
-                            dist = self.precomputed.ignition_to_base(
-                                position, departure_pos, self.get_type()
-                            )
-                        elif isinstance(position, Base) and isinstance(departure_pos, WaterTank):
-                            dist = self.precomputed.water_to_base(
-                                departure_pos, position, self.get_type()
-                            )
-                        elif isinstance(position, WaterTank) and isinstance(departure_pos, Base):
-                            dist = self.precomputed.water_to_base(
-                                position, departure_pos, self.get_type()
-                            )
-                        elif isinstance(position, Lightning) and isinstance(
-                            departure_pos, WaterTank
-                        ):
-                            dist = self.precomputed.ignition_to_water(position, departure_pos)
-                        elif isinstance(position, WaterTank) and isinstance(
-                            departure_pos, Lightning
-                        ):
-                            dist = self.precomputed.ignition_to_water(departure_pos, position)
-                        else:
-                            dist = departure_pos.distance(position)
-                    else:
-                        if isinstance(position, Base) and isinstance(departure_pos, Lightning):
-                            dist = self.precomputed.uav_dist(departure_pos, position)
-                        elif isinstance(position, Lightning) and isinstance(departure_pos, Base):
-                            dist = self.precomputed.uav_dist(position, departure_pos)
-                        else:
-                            dist = departure_pos.distance(position)
-                else:
-                    dist = departure_pos.distance(position)
+                dist = self._leg_distance(departure_pos, position)
             current_fuel -= dist / self.get_range()
             current_time += dist / self.flight_speed
             if isinstance(position, Lightning) and prioritisation_function is not None:
@@ -668,7 +890,8 @@ class Aircraft(Location):  # pylint: disable=too-many-public-methods
                 current_time += self.fuel_refill_time
                 current_fuel = 1.0
             elif isinstance(position, WaterTank):
-                current_time += self._get_water_refill_time()
+                current_time += self.water_refill_time
+            departure_pos = position
         return current_time
 
     def arrival_time(  # pylint: disable=too-many-branches, too-many-arguments
@@ -691,19 +914,16 @@ class Aircraft(Location):  # pylint: disable=too-many-public-methods
         else:
             current_time = state.completion_time
             current_pos = state.position
-        for idx, position in enumerate(positions):
-            if idx == 0:
-                dist = current_pos.distance(position)
-            else:
-                dist = positions[idx - 1].distance(position)
-            current_time += dist / self.flight_speed
-
+        departure_pos = current_pos
+        for position in positions:
+            current_time += departure_pos.distance(position) / self.flight_speed
+            departure_pos = position
             if isinstance(position, Lightning):
                 current_time += self._get_time_at_strike()
             if isinstance(position, Base):
                 current_time += self.fuel_refill_time
             elif isinstance(position, WaterTank):
-                current_time += self._get_water_refill_time()
+                current_time += self.water_refill_time
 
         return current_time
 
@@ -716,27 +936,29 @@ class Aircraft(Location):  # pylint: disable=too-many-public-methods
 
     def _add_update(self, loc_id_no: Optional[int] = None) -> None:
         """Add update to past locations."""
-        previous_update = self.past_locations[-1]
+        past_locations = self.past_locations
+        # Read the previous update from the columns rather than constructing an UpdateEvent
+        previous_time = float(past_locations.times[-1])
+        previous_lat = float(past_locations.lats[-1])
+        previous_lon = float(past_locations.lons[-1])
         distance_hovered = 0.0
-        if previous_update.status in [Status.HOVERING, Status.INSPECTING_STRIKE]:
-            distance_hovered = (self.time - previous_update.time) * self.flight_speed
+        if past_locations.status_codes[-1] in _HOVERING_STATUS_CODES:
+            distance_hovered = (self.time - previous_time) * self.flight_speed
         next_events: List[str] = []
         for event in self.event_queue:
             if isinstance(event.position, (Lightning, Base, WaterTank)):
                 next_events.append(f"{event.departure_status.value} {event.position.id_no}")
-        self.past_locations.append(
-            UpdateEvent(
-                self.get_name(),
-                self.lat,
-                self.lon,
-                self.time,
-                self.status,
-                self.distance(previous_update),
-                self.current_fuel_capacity,
-                self.get_range() * self.current_fuel_capacity,
-                distance_hovered,
-                self._get_water_on_board(),
-                next_events,
-                loc_id_no=loc_id_no,
-            )
+        past_locations.add(
+            self.get_name(),
+            self.lat,
+            self.lon,
+            self.time,
+            self.status,
+            haversine_distance(self.lat, self.lon, previous_lat, previous_lon),
+            self.current_fuel_capacity,
+            self.get_range() * self.current_fuel_capacity,
+            distance_hovered,
+            self.water_on_board,
+            next_events,
+            loc_id_no=loc_id_no,
         )
@@ -6,7 +6,8 @@ from typing import List
 import numpy as np
 from matplotlib import path
 
-from bushfire_drone_simulation.fire_utils import EARTH_RADIUS, Location, Target, average_location
+from bushfire_drone_simulation.fire_utils import Location, Target, average_location
+from bushfire_drone_simulation.kernels import EARTH_RADIUS
 from bushfire_drone_simulation.lightning import Lightning
 from bushfire_drone_simulation.units import Distance, Duration
 
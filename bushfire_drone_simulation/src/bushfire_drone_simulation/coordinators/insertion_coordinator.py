@@ -8,17 +8,16 @@ strike and rather discounts the option if it does not possess enough fuel or wat
 """
 
 import logging
+from itertools import compress
 from math import inf
 from typing import List, Optional, Union
 
-import numpy as np
-
 from bushfire_drone_simulation.aircraft import Event
 from bushfire_drone_simulation.coordinators.abstract_coordinator import (
     UAVCoordinator,
     WBCoordinator,
 )
-from bushfire_drone_simulation.fire_utils import Base, Location
+from bushfire_drone_simulation.fire_utils import Base, Location, closest_location_index
 from bushfire_drone_simulation.lightning import Lightning
 from bushfire_drone_simulation.linked_list import Node
 from bushfire_drone_simulation.uav import UAV
@@ -39,7 +38,7 @@ class InsertionUAVCoordinator(UAVCoordinator):
     ) -> None:
         """Receive lightning strike that just occurred and assign best uav."""
         if self.precomputed is None:
-            base_index = int(np.argmin(list(map(lightning.distance, self.uav_bases))))
+            base_index = closest_location_index(lightning, self.uav_bases)
         else:
             base_index = self.precomputed.closest_uav_base(lightning)
         min_arrival_time: float = inf
@@ -58,11 +57,7 @@ class InsertionUAVCoordinator(UAVCoordinator):
                     if self.precomputed is None:
                         base = [
                             self.uav_bases[
-                                int(
-                                    np.argmin(
-                                        list(map(last_event_position.distance, self.uav_bases))
-                                    )
-                                )
+                                closest_location_index(last_event_position, self.uav_bases)
                             ]
                         ]
                     else:
@@ -167,7 +162,7 @@ class InsertionWBCoordinator(WBCoordinator):
                 if not isinstance(last_event_position, Base):
                     if self.precomputed is None or not isinstance(last_event_position, Lightning):
                         closest_base_to_last_event = [
-                            bases[int(np.argmin(list(map(last_event_position.distance, bases))))]
+                            bases[closest_location_index(last_event_position, bases)]
                         ]
                     else:
                         closest_base_to_last_event = [
@@ -207,7 +202,7 @@ class InsertionWBCoordinator(WBCoordinator):
                             best_water_bomber = water_bomber
 
             if self.precomputed is None:
-                base_index = int(np.argmin(list(map(ignition.distance, bases))))
+                base_index = closest_location_index(ignition, bases)
             else:
                 base_index = self.precomputed.closest_wb_base(ignition, water_bomber.get_type())
             if water_bomber.enough_water([ignition]):
@@ -238,11 +233,12 @@ class InsertionWBCoordinator(WBCoordinator):
                 # (assuming if we go via a water tank we have enough water)
                 _LOG.debug("%s needs to go via a water tank", water_bomber.get_name())
                 go_via_base = True
-                for water_tank in self.water_tanks:
+                tanks_with_water = water_bomber.check_water_tanks(self.water_tanks)
+                for water_tank in compress(self.water_tanks, tanks_with_water):
                     temp_arr_time = water_bomber.enough_fuel(
                         [water_tank, ignition, bases[base_index]], self.prioritisation_function
                     )
-                    if water_bomber.check_water_tank(water_tank) and temp_arr_time is not None:
+                    if temp_arr_time is not None:
                         if temp_arr_time < min_arrival_time:
                             min_arrival_time = temp_arr_time
                             best_water_bomber = water_bomber
@@ -250,7 +246,7 @@ class InsertionWBCoordinator(WBCoordinator):
                             go_via_base = False
                             start_from = None
                 if go_via_base:
-                    for water_tank in self.water_tanks:
+                    for water_tank in compress(self.water_tanks, tanks_with_water):
                         for base in bases:
                             temp_arr_time = water_bomber.enough_fuel(
                                 [
@@ -261,10 +257,7 @@ class InsertionWBCoordinator(WBCoordinator):
                                 ],
                                 self.prioritisation_function,
                             )
-                            if (
-                                water_bomber.check_water_tank(water_tank)
-                                and temp_arr_time is not None
-                            ):
+                            if temp_arr_time is not None:
                                 if temp_arr_time < min_arrival_time:
                                     min_arrival_time = temp_arr_time
                                     best_water_bomber = water_bomber
@@ -279,10 +272,7 @@ class InsertionWBCoordinator(WBCoordinator):
                                 ],
                                 self.prioritisation_function,
                             )
-                            if (
-                                water_bomber.check_water_tank(water_tank)
-                                and temp_arr_time is not None
-                            ):
+                            if temp_arr_time is not None:
                                 if temp_arr_time < min_arrival_time:
                                     min_arrival_time = temp_arr_time
                                     best_water_bomber = water_bomber
@@ -9,22 +9,21 @@ strike and rather discounts the option if it does not possess enough fuel or wat
 """
 
 import logging
+from itertools import compress
 from math import inf
 from typing import Callable, Dict, List, Optional, Union
 
-import numpy as np
-
 from bushfire_drone_simulation.aircraft import Event
 from bushfire_drone_simulation.coordinators.abstract_coordinator import (
     UAVCoordinator,
     WBCoordinator,
 )
-from bushfire_drone_simulation.fire_utils import Base, Location, WaterTank
+from bushfire_drone_simulation.fire_utils import Base, Location, WaterTank, closest_location_index
 from bushfire_drone_simulation.lightning import AllocatedLightning, Lightning
 from bushfire_drone_simulation.linked_list import Node
 from bushfire_drone_simulation.parameters import JSONParameters
 from bushfire_drone_simulation.uav import UAV
-from bushfire_drone_simulation.units import DEFAULT_DURATION_UNITS, Duration
+from bushfire_drone_simulation.units import to_default_duration
 from bushfire_drone_simulation.water_bomber import WaterBomber
 
 _LOG = logging.getLogger(__name__)
@@ -64,9 +63,9 @@ class MinimiseMeanTimeUAVCoordinator(UAVCoordinator):
         if target_from_params == "inf":
             target_max_time = inf
         else:
-            target_max_time = Duration(target_from_params, "hr").get(DEFAULT_DURATION_UNITS)
+            target_max_time = to_default_duration(target_from_params, "hr")
         if self.precomputed is None:
-            index_of_closest_base = int(np.argmin(list(map(lightning.distance, self.uav_bases))))
+            index_of_closest_base = closest_location_index(lightning, self.uav_bases)
         else:
             index_of_closest_base = self.precomputed.closest_uav_base(lightning)
         min_arrival_time: float = inf
@@ -89,7 +88,7 @@ class MinimiseMeanTimeUAVCoordinator(UAVCoordinator):
                 if isinstance(last_event_position, Lightning):
                     if self.precomputed is None:
                         closest_base_to_last_event = self.uav_bases[
-                            int(np.argmin(list(map(last_event_position.distance, self.uav_bases))))
+                            closest_location_index(last_event_position, self.uav_bases)
                         ]
                     else:
                         closest_base_to_last_event = self.uav_bases[
@@ -343,7 +342,7 @@ class MinimiseMeanTimeWBCoordinator(WBCoordinator):
         if target_from_params == "inf":
             target_max_time = inf
         else:
-            target_max_time = Duration(target_from_params, "hr").get(DEFAULT_DURATION_UNITS)
+            target_max_time = to_default_duration(target_from_params, "hr")
         assert ignition.inspected_time is not None, "Error: Ignition was not inspected."
         min_arrival_time: float = inf
         min_arr_time_above_target: float = inf
@@ -366,7 +365,7 @@ class MinimiseMeanTimeWBCoordinator(WBCoordinator):
                 if not isinstance(last_event_position, Base):
                     if self.precomputed is None or not isinstance(last_event_position, Lightning):
                         closest_base_to_last_event = bases[
-                            int(np.argmin(list(map(last_event_position.distance, bases))))
+                            closest_location_index(last_event_position, bases)
                         ]
                     else:
                         closest_base_to_last_event = bases[
@@ -427,7 +426,7 @@ class MinimiseMeanTimeWBCoordinator(WBCoordinator):
                                 best_water_bomber = water_bomber
 
             if self.precomputed is None:
-                base_index = int(np.argmin(list(map(ignition.distance, bases))))
+                base_index = closest_location_index(ignition, bases)
             else:
                 base_index = self.precomputed.closest_wb_base(ignition, water_bomber.get_type())
             if water_bomber.enough_water([ignition]):
@@ -476,11 +475,12 @@ class MinimiseMeanTimeWBCoordinator(WBCoordinator):
                 # (assuming if we go via a water tank we have enough water)
                 _LOG.debug("%s needs to go via a water tank", water_bomber.get_name())
                 go_via_base = True
-                for water_tank in self.water_tanks:
+                tanks_with_water = water_bomber.check_water_tanks(self.water_tanks)
+                for water_tank in compress(self.water_tanks, tanks_with_water):
                     temp_arr_time = water_bomber.enough_fuel(
                         [water_tank, ignition, bases[base_index]], self.prioritisation_function
                     )
-                    if water_bomber.check_water_tank(water_tank) and temp_arr_time is not None:
+                    if temp_arr_time is not None:
                         suppression_time = (
                             water_bomber.arrival_time([water_tank, ignition]) - ignition.spawn_time
                         )
@@ -498,7 +498,7 @@ class MinimiseMeanTimeWBCoordinator(WBCoordinator):
                             go_via_base = False
                             start_from = None
                 if go_via_base:
-                    for water_tank in self.water_tanks:
+                    for water_tank in compress(self.water_tanks, tanks_with_water):
                         for base in bases:
                             temp_arr_time = water_bomber.enough_fuel(
                                 [
@@ -509,10 +509,7 @@ class MinimiseMeanTimeWBCoordinator(WBCoordinator):
                                 ],
                                 self.prioritisation_function,
                             )
-                            if (
-                                water_bomber.check_water_tank(water_tank)
-                                and temp_arr_time is not None
-                            ):
+                            if temp_arr_time is not None:
                                 suppression_time = (
                                     water_bomber.arrival_time([water_tank, base, ignition])
                                     - ignition.spawn_time
@@ -542,10 +539,7 @@ class MinimiseMeanTimeWBCoordinator(WBCoordinator):
                                 ],
                                 self.prioritisation_function,
                             )
-                            if (
-                                water_bomber.check_water_tank(water_tank)
-                                and temp_arr_time is not None
-                            ):
+                            if temp_arr_time is not None:
                                 suppression_time = (
                                     water_bomber.arrival_time([base, water_tank, ignition])
                                     - ignition.spawn_time
@@ -5,16 +5,15 @@ Never reevaluates routes for aircraft.
 """
 
 import logging
+from itertools import compress
 from math import inf
 from typing import List, Optional
 
-import numpy as np
-
 from bushfire_drone_simulation.coordinators.abstract_coordinator import (
     UAVCoordinator,
     WBCoordinator,
 )
-from bushfire_drone_simulation.fire_utils import Location
+from bushfire_drone_simulation.fire_utils import Location, closest_location_index
 from bushfire_drone_simulation.lightning import Lightning
 from bushfire_drone_simulation.uav import UAV
 from bushfire_drone_simulation.water_bomber import WaterBomber
@@ -28,7 +27,7 @@ class SimpleUAVCoordinator(UAVCoordinator):
     def process_new_strike(self, lightning: Lightning) -> None:  # pylint: disable=too-many-branches
         """Receive lightning strike that just occurred and assign best uav."""
         if self.precomputed is None:
-            base_index = int(np.argmin(list(map(lightning.distance, self.uav_bases))))
+            base_index = closest_location_index(lightning, self.uav_bases)
         else:
             base_index = self.precomputed.closest_uav_base(lightning)
         min_arrival_time: float = inf
@@ -89,7 +88,7 @@ class SimpleWBCoordinator(WBCoordinator):
         for water_bomber in self.water_bombers:  # pylint: disable=too-many-nested-blocks
             bases = self.water_bomber_bases_dict[water_bomber.type]
             if self.precomputed is None:
-                base_index = int(np.argmin(list(map(ignition.distance, bases))))
+                base_index = closest_location_index(ignition, bases)
             else:
                 base_index = self.precomputed.closest_wb_base(ignition, water_bomber.get_type())
             if water_bomber.enough_water([ignition]):
@@ -119,18 +118,19 @@ class SimpleWBCoordinator(WBCoordinator):
                 # (assuming if we go via a water tank we have enough water)
                 _LOG.debug("%s needs to go via a water tank", water_bomber.get_name())
                 go_via_base = True
-                for water_tank in self.water_tanks:
+                tanks_with_water = water_bomber.check_water_tanks(self.water_tanks)
+                for water_tank in compress(self.water_tanks, tanks_with_water):
                     temp_arr_time = water_bomber.enough_fuel(
                         [water_tank, ignition, bases[base_index]], self.prioritisation_function
                     )
-                    if water_bomber.check_water_tank(water_tank) and temp_arr_time is not None:
+                    if temp_arr_time is not None:
                         if temp_arr_time < min_arrival_time:
                             min_arrival_time = temp_arr_time
                             best_water_bomber = water_bomber
                             assigned_locations = [water_tank, ignition]
                             go_via_base = False
                 if go_via_base:
-                    for water_tank in self.water_tanks:
+                    for water_tank in compress(self.water_tanks, tanks_with_water):
                         for base in bases:
                             temp_arr_time = water_bomber.enough_fuel(
                                 [
@@ -141,10 +141,7 @@ class SimpleWBCoordinator(WBCoordinator):
                                 ],
                                 self.prioritisation_function,
                             )
-                            if (
-                                water_bomber.check_water_tank(water_tank)
-                                and temp_arr_time is not None
-                            ):
+                            if temp_arr_time is not None:
                                 if temp_arr_time < min_arrival_time:
                                     min_arrival_time = temp_arr_time
                                     best_water_bomber = water_bomber
@@ -158,10 +155,7 @@ class SimpleWBCoordinator(WBCoordinator):
                                 ],
                                 self.prioritisation_function,
                             )
-                            if (
-                                water_bomber.check_water_tank(water_tank)
-                                and temp_arr_time is not None
-                            ):
+                            if temp_arr_time is not None:
                                 if temp_arr_time < min_arrival_time:
                                     min_arrival_time = temp_arr_time
                                     best_water_bomber = water_bomber
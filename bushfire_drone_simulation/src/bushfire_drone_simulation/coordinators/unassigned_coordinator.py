@@ -7,7 +7,13 @@ import matplotlib.pyplot as plt
 import numpy as np
 
 from bushfire_drone_simulation.coordinators.abstract_coordinator import UnassignedCoordinator
-from bushfire_drone_simulation.fire_utils import Location, average_location
+from bushfire_drone_simulation.fire_utils import (
+    Location,
+    average_location,
+    closest_location_index,
+    haversine,
+    location_arrays,
+)
 
 
 class SimpleUnassignedCoordinator(UnassignedCoordinator):
@@ -36,32 +42,39 @@ class SimpleUnassignedCoordinator(UnassignedCoordinator):
                     str(current_time) + " plot.png",
                 )
             )
+        # Positions of the idle uavs don't change while targets are assigned, so they are read
+        # into arrays once and the repulsion between every pair of idle uavs is computed at once
+        idle_uavs = [uav for uav in self.uavs if uav.event_queue.is_empty()]
+        idle_lats, idle_lons = location_arrays(idle_uavs)
+        idle_ids = np.fromiter((uav.id_no for uav in idle_uavs), int, count=len(idle_uavs))
+        idle_dists = haversine(
+            idle_lats[:, np.newaxis], idle_lons[:, np.newaxis], idle_lats, idle_lons
+        )
+        idle_idx = -1
         for uav in self.uavs:  # pylint: disable=too-many-nested-blocks
             if uav.event_queue.is_empty():
+                idle_idx += 1
                 if self.outside_boundary(uav):
                     actual_loc = uav.intermediate_point(
                         self.centre_loc,
                         self.dt / (uav.distance(self.centre_loc) / uav.flight_speed),
                     )
-                    base = self.uav_bases[
-                        int(np.argmin(list(map(actual_loc.distance, self.uav_bases))))
-                    ]
+                    base = self.uav_bases[closest_location_index(actual_loc, self.uav_bases)]
                     if uav.enough_fuel([actual_loc, base]) is not None:
                         uav.unassiged_aircraft_to_location(self.centre_loc, self.dt)
                     else:
                         uav.unassigned_target = None
                 else:
-                    contributing_locs: List[Location] = []
-                    for other_uav in self.uavs:
-                        if other_uav.id_no != uav.id_no and other_uav.event_queue.is_empty():
-                            dist = uav.distance(other_uav)
-                            if dist != 0:
-                                contributing_locs.append(
-                                    uav.plane_intermediate_point(
-                                        other_uav,
-                                        -self.uav_const * dist**self.uav_pwr,
-                                    )
-                                )
+                    dists = idle_dists[idle_idx]
+                    repelling = (idle_ids != uav.id_no) & (dists != 0)
+                    percentages = -self.uav_const * dists[repelling] ** self.uav_pwr
+                    contributing_locs: List[Location] = [
+                        Location(lat, lon)
+                        for lat, lon in zip(
+                            ((1 - percentages) * uav.lat + percentages * idle_lats[repelling]),
+                            ((1 - percentages) * uav.lon + percentages * idle_lons[repelling]),
+                        )
+                    ]
                     for target in self.targets:
                         if target.currently_active(current_time):
                             dist = uav.distance(target)
@@ -101,7 +114,7 @@ class SimpleUnassignedCoordinator(UnassignedCoordinator):
                             uav.unassigned_target = boundary_target
                         else:
                             base = self.uav_bases[
-                                int(np.argmin(list(map(actual_loc.distance, self.uav_bases))))
+                                closest_location_index(actual_loc, self.uav_bases)
                             ]
                             if uav.enough_fuel([actual_loc, base]) is not None:
                                 uav.unassiged_aircraft_to_location(uav_target_loc, self.dt)
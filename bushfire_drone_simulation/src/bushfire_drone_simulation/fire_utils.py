@@ -2,14 +2,22 @@
 
 import logging
 from math import atan2, cos, degrees, inf, radians, sin, sqrt
-from typing import Any, List, Tuple
-
+from typing import Any, Dict, List, Sequence, Tuple, Union
+
+import numpy as np
+import numpy.typing as npt
+
+from bushfire_drone_simulation.kernels import (
+    EARTH_RADIUS,
+    OTHER_POSITION,
+    WATER_TANK_POSITION,
+    closest_index,
+    haversine_distance,
+)
 from bushfire_drone_simulation.units import DEFAULT_DURATION_UNITS, Duration
 
 _LOG = logging.getLogger(__name__)
 
-EARTH_RADIUS = 6371  # in km
-
 
 class Coordinate:
     """Coordinate."""
@@ -23,6 +31,9 @@ class Coordinate:
 class Location:
     """Position in worldwide latitude and longitude coordinates."""
 
+    # Kind of position used by WaterBomber.enough_water (overridden by strikes and water tanks)
+    position_kind: int = OTHER_POSITION
+
     def __init__(self, latitude: float, longitude: float):
         """Initialise from latitude and longitude coordinates."""
         self.lat = latitude
@@ -30,13 +41,8 @@ class Location:
 
     def distance(self, other: "Location") -> float:
         """Find Euclidian distance in km between two locations."""
-        temp = (
-            sin(radians(other.lat - self.lat) / 2) ** 2
-            + cos(radians(self.lat))
-            * cos(radians(other.lat))
-            * sin(radians(other.lon - self.lon) / 2) ** 2
-        )
-        return EARTH_RADIUS * 2 * atan2(sqrt(temp), sqrt(1 - temp))
+        distance: float = haversine_distance(self.lat, self.lon, other.lat, other.lon)
+        return distance
 
     def plane_distance_sq(self, other: "Location") -> float:
         """Find planar distance squared in degrees between two locations."""
@@ -141,6 +147,8 @@ class Base(Location):
 class WaterTank(Location):
     """Water tank's location and capacity."""
 
+    position_kind = WATER_TANK_POSITION
+
     def __init__(self, latitude: float, longitude: float, capacity: float, id_no: int):
         """Initialise watertank from location and capacity."""
         super().__init__(latitude, longitude)
@@ -189,6 +197,57 @@ class WaterTank(Location):
         return self.capacity
 
 
+def location_arrays(
+    locations: Sequence[Location],
+) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64]]:
+    """Return arrays of the latitudes and longitudes of a sequence of locations."""
+    lats = np.fromiter((location.lat for location in locations), float, count=len(locations))
+    lons = np.fromiter((location.lon for location in locations), float, count=len(locations))
+    return lats, lons
+
+
+_LOCATION_ARRAYS_CACHE: Dict[
+    int, Tuple[Sequence[Location], npt.NDArray[np.float64], npt.NDArray[np.float64]]
+] = {}
+
+
+def closest_location_index(location: Location, locations: Sequence[Location]) -> int:
+    """Return the index of the closest of a sequence of locations to a given location.
+
+    The sequences searched (bases) do not change, so their coordinate arrays are cached.
+    """
+    cached = _LOCATION_ARRAYS_CACHE.get(id(locations))
+    if cached is None or cached[0] is not locations or len(cached[1]) != len(locations):
+        if len(_LOCATION_ARRAYS_CACHE) >= 64:
+            _LOCATION_ARRAYS_CACHE.clear()
+        cached = (locations, *location_arrays(locations))
+        _LOCATION_ARRAYS_CACHE[id(locations)] = cached
+    return int(closest_index(location.lat, location.lon, cached[1], cached[2]))
+
+
+def haversine(
+    lat_1: Union[float, npt.NDArray[np.float64]],
+    lon_1: Union[float, npt.NDArray[np.float64]],
+    lat_2: Union[float, npt.NDArray[np.float64]],
+    lon_2: Union[float, npt.NDArray[np.float64]],
+) -> npt.NDArray[np.float64]:
+    """Vectorised version of Location.distance.
+
+    Find the distance in km between (lat_1, lon_1) and (lat_2, lon_2), where the arguments are
+    broadcast against each other.
+    """
+    temp = (
+        np.sin(np.radians(np.subtract(lat_2, lat_1)) / 2) ** 2
+        + np.cos(np.radians(lat_1))
+        * np.cos(np.radians(lat_2))
+        * np.sin(np.radians(np.subtract(lon_2, lon_1)) / 2) ** 2
+    )
+    distance: npt.NDArray[np.float64] = (
+        EARTH_RADIUS * 2 * np.arctan2(np.sqrt(temp), np.sqrt(1 - temp))
+    )
+    return distance
+
+
 def average_location(locations: List[Location]) -> Location:
     """Return the average location given a list of locations."""
     lat_sum: float = 0
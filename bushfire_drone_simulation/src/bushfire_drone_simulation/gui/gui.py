@@ -627,7 +627,8 @@ class GUI:
             self.start_time.set(self.end_time.get())
         self.update_objects()
 
-    def run_events(self) -> None:
-        """Run all current events."""
-        while self.window.dooneevent(_tkinter.ALL_EVENTS | _tkinter.DONT_WAIT):
-            pass
+    def run_events(self, max_events: int = 1024) -> None:
+        """Run current events until none are pending or max_events have been run."""
+        for _ in range(max_events):
+            if not self.window.dooneevent(_tkinter.ALL_EVENTS | _tkinter.DONT_WAIT):
+                break
@@ -4,7 +4,7 @@ import math
 from pathlib import Path
 from typing import Dict, List, Optional, Sequence, Type, TypeVar
 
-from bushfire_drone_simulation.aircraft import Aircraft, Status, UpdateEvent
+from bushfire_drone_simulation.aircraft import Aircraft, PastLocations, Status, UpdateEvent
 from bushfire_drone_simulation.fire_utils import Location, Time
 from bushfire_drone_simulation.gui.gui_objects import (
     GUIAircraft,
@@ -250,7 +250,7 @@ def extract_simulation_aircraft(
     else:
         aircraft_list = simulation.uavs
     for aircraft in aircraft_list:
-        to_return.append(aircraft_type(aircraft.past_locations))
+        to_return.append(aircraft_type(list(aircraft.past_locations)))
         new_aircraft = to_return[-1]
         if isinstance(new_aircraft, GUIUav):
             assert isinstance(aircraft, UAV)
@@ -480,7 +480,7 @@ def extract_aircraft_from_output(
             for water_bomber in wbs:
                 if aircraft_id == water_bomber.name:
                     aircraft.copy_from_wb(water_bomber)
-        aircraft.past_locations = updates
+        aircraft.past_locations = PastLocations(updates)
         for update in updates:
             if update.status == Status.INSPECTING_STRIKE:
                 assert update.loc_id_no is not None, "Lightning loc id should be int, not None"
@@ -0,0 +1,42 @@
+"""Numba compiled kernels for the numerical hot spots of the simulation."""
+
+from math import atan2, cos, inf, radians, sin, sqrt
+
+import numpy as np
+import numpy.typing as npt
+from numba import njit
+
+EARTH_RADIUS = 6371  # in km
+
+# Kinds of position in a route checked by WaterBomber.enough_water
+OTHER_POSITION = 0
+STRIKE_POSITION = 1
+WATER_TANK_POSITION = 2
+
+
+@njit(cache=True)
+def haversine_distance(lat_1: float, lon_1: float, lat_2: float, lon_2: float) -> float:
+    """Find the great circle distance in km between two latitude longitude coordinates."""
+    temp = (
+        sin(radians(lat_2 - lat_1) / 2) ** 2
+        + cos(radians(lat_1)) * cos(radians(lat_2)) * sin(radians(lon_2 - lon_1) / 2) ** 2
+    )
+    return EARTH_RADIUS * 2 * atan2(sqrt(temp), sqrt(1 - temp))
+
+
+@njit(cache=True)
+def closest_index(
+    lat: float, lon: float, lats: npt.NDArray[np.float64], lons: npt.NDArray[np.float64]
+) -> int:
+    """Return the index of the coordinates in (lats, lons) closest to (lat, lon).
+
+    The first index is returned if several coordinates are equally close.
+    """
+    best_idx = 0
+    best_dist = inf
+    for idx in range(lats.shape[0]):
+        dist = haversine_distance(lat, lon, lats[idx], lons[idx])
+        if dist < best_dist:
+            best_idx = idx
+            best_dist = dist
+    return best_idx
@@ -5,11 +5,14 @@ from collections import namedtuple
 from typing import List, Union
 
 from bushfire_drone_simulation.fire_utils import Location
+from bushfire_drone_simulation.kernels import STRIKE_POSITION
 
 
 class Lightning(Location):
     """Class for individual lightning strikes."""
 
+    position_kind = STRIKE_POSITION
+
     def __init__(
         self,
         latitude: float,
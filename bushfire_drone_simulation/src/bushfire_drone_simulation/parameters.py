@@ -306,15 +306,15 @@ class JSONParameters:
                     id_no=i,
                     latitude=lat,
                     longitude=lon,
-                    flight_speed=water_bomber["flight_speed"],
-                    fuel_refill_time=water_bomber["fuel_refill_time"],
-                    suppression_time=water_bomber["suppression_time"],
-                    water_refill_time=water_bomber["water_refill_time"],
-                    water_per_suppression=water_bomber["water_per_suppression"],
-                    range_empty=water_bomber["range_empty"],
-                    range_under_load=water_bomber["range_under_load"],
-                    water_capacity=water_bomber["water_capacity"],
-                    pct_fuel_cutoff=water_bomber["pct_fuel_cutoff"],
+                    flight_speed=float(water_bomber["flight_speed"]),
+                    fuel_refill_time=float(water_bomber["fuel_refill_time"]),
+                    suppression_time=float(water_bomber["suppression_time"]),
+                    water_refill_time=float(water_bomber["water_refill_time"]),
+                    water_per_suppression=float(water_bomber["water_per_suppression"]),
+                    range_empty=float(water_bomber["range_empty"]),
+                    range_under_load=float(water_bomber["range_under_load"]),
+                    water_capacity=float(water_bomber["water_capacity"]),
+                    pct_fuel_cutoff=float(water_bomber["pct_fuel_cutoff"]),
                     bomber_type=water_bomber_type,
                 )
                 water_bombers.append(
@@ -416,11 +416,11 @@ class JSONParameters:
                 id_no=i,
                 latitude=lat,
                 longitude=lon,
-                flight_speed=uav_data["flight_speed"],
-                fuel_refill_time=uav_data["fuel_refill_time"],
-                range=uav_data["range"],
-                inspection_time=uav_data["inspection_time"],
-                pct_fuel_cutoff=uav_data["pct_fuel_cutoff"],
+                flight_speed=float(uav_data["flight_speed"]),
+                fuel_refill_time=float(uav_data["fuel_refill_time"]),
+                range=float(uav_data["range"]),
+                inspection_time=float(uav_data["inspection_time"]),
+                pct_fuel_cutoff=float(uav_data["pct_fuel_cutoff"]),
             )
             uavs.append(
                 UAV(
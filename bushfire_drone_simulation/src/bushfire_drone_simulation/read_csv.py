@@ -15,7 +15,11 @@ from bushfire_drone_simulation.fire_utils import (
     assert_number,
 )
 from bushfire_drone_simulation.lightning import Lightning
-from bushfire_drone_simulation.units import DEFAULT_DURATION_UNITS, Duration, Volume
+from bushfire_drone_simulation.units import (
+    DEFAULT_DURATION_UNITS,
+    to_default_duration,
+    to_default_volume,
+)
 
 
 class ColumnNotFoundException(Exception):
@@ -135,7 +139,7 @@ def read_water_tanks(filename: Path, capacity_units: str = "L") -> List[WaterTan
             lons[i],
             f"Error: The longitude on row {i+1} of '{filename}' ('{lons[i]}') is not a number",
         )
-        to_return.append(WaterTank(lat, lon, Volume(cap, capacity_units).get(), i))
+        to_return.append(WaterTank(lat, lon, to_default_volume(cap, capacity_units), i))
     return to_return
 
 
@@ -264,8 +268,8 @@ def read_targets(filename: Path) -> List[Target]:
             Target(
                 lat,
                 lon,
-                Duration(start_time, "hr").get(),
-                Duration(finish_time, "hr").get(),
+                to_default_duration(start_time, "hr"),
+                to_default_duration(finish_time, "hr"),
                 attraction_const,
                 attraction_power,
                 automatic[i],
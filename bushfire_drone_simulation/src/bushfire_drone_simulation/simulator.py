@@ -4,7 +4,7 @@ import csv
 import multiprocessing
 from copy import copy
 from math import inf
-from typing import Dict, List, Optional, Tuple, Type, Union
+from typing import Dict, Iterator, List, Optional, Tuple, Type, Union
 
 from tqdm.std import tqdm
 
@@ -219,20 +219,23 @@ def run_simulations(params: JSONParameters, use_parallel: bool = False) -> List[
     """Run bushfire drone simulation."""
     params.write_to_input_parameters_folder()
     simulators = [Simulator(params, i) for i in range(len(params.scenarios))]
-    with multiprocessing.Pool(multiprocessing.cpu_count()) as pool:
-        for simulator in tqdm(
-            pool.imap_unordered(run_simulation, simulators)
-            if use_parallel
-            else map(run_simulation, simulators),
-            total=len(simulators),
-            unit="scenario",
-            smoothing=0,
-        ):
-            simulators[simulator.scenario_idx] = simulator
+    if use_parallel:
+        with multiprocessing.Pool(multiprocessing.cpu_count()) as pool:
+            _collect_simulations(pool.imap_unordered(run_simulation, simulators), simulators)
+    else:
+        # Creating a pool for a serial run is not free, and hangs on shutdown once gevent has
+        # monkey patched queue (the GUI map downloader imports grequests)
+        _collect_simulations(map(run_simulation, simulators), simulators)
     write_to_summary_file(simulators, params)
     return simulators
 
 
+def _collect_simulations(results: Iterator[Simulator], simulators: List[Simulator]) -> None:
+    """Store each finished simulation in simulators, showing progress as they finish."""
+    for simulator in tqdm(results, total=len(simulators), unit="scenario", smoothing=0):
+        simulators[simulator.scenario_idx] = simulator
+
+
 def write_to_summary_file(simulations: List[Simulator], params: JSONParameters) -> None:
     """Write summary results from each simulation to summary file."""
     with open(
@@ -1,14 +1,35 @@
 """UAV Class."""
 
-from pydantic.main import BaseModel
+import sys
+from dataclasses import dataclass
+from typing import Any, Tuple
 
-from bushfire_drone_simulation.aircraft import Aircraft, AircraftType, UpdateEvent
-from bushfire_drone_simulation.units import Distance, Duration, Speed
+from bushfire_drone_simulation.aircraft import Aircraft, AircraftType, PastLocations, UpdateEvent
+from bushfire_drone_simulation.units import (
+    to_default_distance,
+    to_default_duration,
+    to_default_speed,
+)
 
 
-class UAVAttributes(BaseModel):
+@dataclass(frozen=True)
+class UAVAttributes:
     """UAV attributes."""
 
+    # dataclass(slots=True) needs Python 3.10. Frozen dataclasses with hand-written slots cannot
+    # be unpickled by default (restoring the slots raises FrozenInstanceError), so pickling
+    # goes through __getstate__ and __setstate__
+    __slots__ = (
+        "id_no",
+        "latitude",
+        "longitude",
+        "flight_speed",
+        "fuel_refill_time",
+        "range",
+        "inspection_time",
+        "pct_fuel_cutoff",
+    )
+
     id_no: int
     latitude: float
     longitude: float
@@ -18,10 +39,23 @@ class UAVAttributes(BaseModel):
     inspection_time: float
     pct_fuel_cutoff: float
 
+    def __getstate__(self) -> Tuple[Any, ...]:
+        """Return the slot values to pickle."""
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        """Restore the slot values when unpickling, bypassing the frozen __setattr__."""
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
 
 class UAV(Aircraft):
     """UAV class for unmanned aircraft searching lightning strikes."""
 
+    __slots__ = ("name", "total_range", "inspection_time")
+
+    _COPY_ATTRS = Aircraft._COPY_ATTRS + __slots__
+
     def __init__(
         self,
         attributes: UAVAttributes,
@@ -39,30 +73,33 @@ class UAV(Aircraft):
         super().__init__(
             attributes.latitude,
             attributes.longitude,
-            Speed(int(attributes.flight_speed), "km", "hr").get(),
-            Duration(int(attributes.fuel_refill_time), "min").get(),
+            to_default_speed(attributes.flight_speed, "km", "hr"),
+            to_default_duration(attributes.fuel_refill_time, "min"),
             attributes.id_no,
             starting_at_base,
             initial_fuel,
             attributes.pct_fuel_cutoff,
         )
-        self.total_range: float = Distance(int(attributes.range), "km").get()
-        self.inspection_time: float = Duration(attributes.inspection_time, "min").get()
-        self.past_locations = [
-            UpdateEvent(
-                self.get_name(),
-                self.lat,
-                self.lon,
-                self.time,
-                self.status,
-                0,
-                self.current_fuel_capacity,
-                self.get_range(),
-                0,
-                0,
-                [],
-            )
-        ]
+        self.name: str = sys.intern(f"uav {self.id_no}")
+        self.total_range: float = to_default_distance(attributes.range, "km")
+        self.inspection_time: float = to_default_duration(attributes.inspection_time, "min")
+        self.past_locations = PastLocations(
+            [
+                UpdateEvent(
+                    self.get_name(),
+                    self.lat,
+                    self.lon,
+                    self.time,
+                    self.status,
+                    0,
+                    self.current_fuel_capacity,
+                    self.get_range(),
+                    0,
+                    0,
+                    [],
+                )
+            ]
+        )
 
     @classmethod
     def aircraft_type(cls) -> AircraftType:
@@ -75,7 +112,7 @@ class UAV(Aircraft):
         Args:
             other ("UAV"): other
         """
-        self.__dict__.update(other.__dict__)
+        self.copy_from_aircraft(other)
 
     def get_range(self) -> float:
         """Return total range of UAV."""
@@ -83,7 +120,7 @@ class UAV(Aircraft):
 
     def get_name(self) -> str:
         """Return name of UAV."""
-        return f"uav {self.id_no}"
+        return self.name
 
     def _get_time_at_strike(self) -> float:
         """Return inspection time of UAV."""
@@ -2,7 +2,7 @@
 
 import abc
 from copy import deepcopy
-from typing import TypeVar, Union
+from typing import Any, Dict, TypeVar, Union
 
 DEFAULT_DISTANCE_UNITS = "km"
 DISTANCE_FACTORS = {"mm": 0.001, "cm": 0.01, "m": 1.0, "km": 1000}
@@ -19,11 +19,23 @@ UnitsType = TypeVar("UnitsType", bound="Units")  # pylint: disable=invalid-name
 class Units:
     """Units class for easy unit conversion."""
 
+    __slots__ = ("value",)
+
     @abc.abstractmethod
     def __init__(self, value: float):
         """Initialize units."""
         self.value = value
 
+    def __copy__(self: UnitsType) -> UnitsType:
+        """Copy units without going through the generic copy protocol."""
+        to_return = self.__class__.__new__(self.__class__)
+        to_return.value = self.value
+        return to_return
+
+    def __deepcopy__(self: UnitsType, memo: Dict[int, Any]) -> UnitsType:
+        """Deep copy units (the value is immutable so this is the same as a shallow copy)."""
+        return self.__copy__()
+
     def __lt__(self, other: "Units") -> bool:
         """Less than operator of Distance."""
         if isinstance(other, (float, int)):
@@ -65,17 +77,20 @@ class Units:
         return self.value >= other.value
 
     def __truediv__(self: UnitsType, other: UnitsType) -> float:
-        """Division operator for Units."""
-        assert isinstance(self, type(other)), (
-            "Units in division are not the same. To divide a distance by speed or time, "
-            "use distance.div_by_speed(speed) or distance.div_by_time(time) respectively."
-        )
+        """Division operator for Units.
+
+        Both units must be the same type (which is enforced by the type annotations). To divide
+        a distance by speed or time, use distance.div_by_speed(speed) or distance.div_by_time(time)
+        respectively.
+        """
         return self.value / other.value
 
 
 class Distance(Units):
     """Distance class for easy unit conversion. Distance stored internally as metres."""
 
+    __slots__ = ()
+
     def __init__(self, distance: float, units: str = DEFAULT_DISTANCE_UNITS):
         """Initialize distance specifying units.
 
@@ -116,6 +131,8 @@ class Distance(Units):
 class Duration(Units):
     """Duration class for easy unit conversion. Duration stored internally as seconds."""
 
+    __slots__ = ()
+
     def __init__(self, duration: float, units: str = DEFAULT_DURATION_UNITS):
         """Initialize duration specifying units.
 
@@ -145,6 +162,8 @@ class Duration(Units):
 class Speed(Units):
     """Speed class for easy unit conversion. Speed stored internally as metres/second."""
 
+    __slots__ = ()
+
     def __init__(
         self,
         speed: float,
@@ -185,6 +204,8 @@ class Speed(Units):
 class Volume(Units):  # pylint: disable=too-few-public-methods
     """Volume class for easy unit conversion. Volume stored internally as litres."""
 
+    __slots__ = ()
+
     def __init__(self, volume: float, units: str = DEFAULT_VOLUME_UNITS):
         """Initialize distance specifying units.
 
@@ -198,3 +219,43 @@ class Volume(Units):  # pylint: disable=too-few-public-methods
         Defaults to DEFAULT_VOLUME_UNITS if units not specified.
         """
         return self.value / VOLUME_FACTORS[units]
+
+
+# Factors converting from each unit to the default units, folded once at import
+_TO_DEFAULT_DISTANCE = {
+    units: factor / DISTANCE_FACTORS[DEFAULT_DISTANCE_UNITS]
+    for units, factor in DISTANCE_FACTORS.items()
+}
+_TO_DEFAULT_DURATION = {
+    units: factor / DURATION_FACTORS[DEFAULT_DURATION_UNITS]
+    for units, factor in DURATION_FACTORS.items()
+}
+_TO_DEFAULT_SPEED = {
+    (distance_units, time_units): _TO_DEFAULT_DISTANCE[distance_units]
+    / _TO_DEFAULT_DURATION[time_units]
+    for distance_units in DISTANCE_FACTORS
+    for time_units in DURATION_FACTORS
+}
+_TO_DEFAULT_VOLUME = {
+    units: factor / VOLUME_FACTORS[DEFAULT_VOLUME_UNITS] for units, factor in VOLUME_FACTORS.items()
+}
+
+
+def to_default_distance(distance: float, units: str) -> float:
+    """Convert a distance in the given units to DEFAULT_DISTANCE_UNITS."""
+    return distance * _TO_DEFAULT_DISTANCE[units]
+
+
+def to_default_duration(duration: float, units: str) -> float:
+    """Convert a duration in the given units to DEFAULT_DURATION_UNITS."""
+    return duration * _TO_DEFAULT_DURATION[units]
+
+
+def to_default_speed(speed: float, distance_units: str, time_units: str) -> float:
+    """Convert a speed in the given units to the default speed units."""
+    return speed * _TO_DEFAULT_SPEED[(distance_units, time_units)]
+
+
+def to_default_volume(volume: float, units: str) -> float:
+    """Convert a volume in the given units to DEFAULT_VOLUME_UNITS."""
+    return volume * _TO_DEFAULT_VOLUME[units]
@@ -1,20 +1,59 @@
 """Water bomber class."""
 
-from math import inf
-from typing import List, Optional, Union
+import sys
+from dataclasses import dataclass
+from typing import Any, List, Optional, Tuple, Union
 
 import numpy as np
-from pydantic.main import BaseModel
+import numpy.typing as npt
 
-from bushfire_drone_simulation.aircraft import Aircraft, AircraftType, Event, UpdateEvent
-from bushfire_drone_simulation.fire_utils import Base, Location, WaterTank
-from bushfire_drone_simulation.lightning import Lightning
-from bushfire_drone_simulation.units import Distance, Duration, Speed, Volume
+from bushfire_drone_simulation.aircraft import (
+    Aircraft,
+    AircraftType,
+    Event,
+    PastLocations,
+    UpdateEvent,
+)
+from bushfire_drone_simulation.fire_utils import (
+    Base,
+    Location,
+    WaterTank,
+    closest_location_index,
+    haversine,
+    location_arrays,
+)
+from bushfire_drone_simulation.kernels import STRIKE_POSITION, WATER_TANK_POSITION
+from bushfire_drone_simulation.units import (
+    to_default_distance,
+    to_default_duration,
+    to_default_speed,
+    to_default_volume,
+)
 
 
-class WBAttributes(BaseModel):
+@dataclass(frozen=True)
+class WBAttributes:
     """Water Bomber attributes."""
 
+    # dataclass(slots=True) needs Python 3.10. Frozen dataclasses with hand-written slots cannot
+    # be unpickled by default (restoring the slots raises FrozenInstanceError), so pickling
+    # goes through __getstate__ and __setstate__
+    __slots__ = (
+        "id_no",
+        "latitude",
+        "longitude",
+        "flight_speed",
+        "fuel_refill_time",
+        "suppression_time",
+        "water_refill_time",
+        "water_per_suppression",
+        "range_empty",
+        "range_under_load",
+        "water_capacity",
+        "pct_fuel_cutoff",
+        "bomber_type",
+    )
+
     id_no: int
     latitude: float
     longitude: float
@@ -29,10 +68,36 @@ class WBAttributes(BaseModel):
     pct_fuel_cutoff: float
     bomber_type: str
 
+    def __getstate__(self) -> Tuple[Any, ...]:
+        """Return the slot values to pickle."""
+        return tuple(getattr(self, name) for name in self.__slots__)
+
+    def __setstate__(self, state: Tuple[Any, ...]) -> None:
+        """Restore the slot values when unpickling, bypassing the frozen __setattr__."""
+        for name, value in zip(self.__slots__, state):
+            object.__setattr__(self, name, value)
+
 
 class WaterBomber(Aircraft):
     """Class for aircraft that contain water for dropping on potential fires."""
 
+    __slots__ = (
+        "range_empty",
+        "range_under_load",
+        "water_refill_time",
+        "suppression_time",
+        "water_per_suppression",
+        "water_capacity",
+        "_water_on_board",
+        "_range_per_water",
+        "_range",
+        "type",
+        "name",
+        "_water_tank_cache",
+    )
+
+    _COPY_ATTRS = Aircraft._COPY_ATTRS + __slots__
+
     def __init__(
         self,
         attributes: WBAttributes,
@@ -51,37 +116,53 @@ class WaterBomber(Aircraft):
         super().__init__(
             attributes.latitude,
             attributes.longitude,
-            Speed(int(attributes.flight_speed), "km", "hr").get(),
-            Duration(int(attributes.fuel_refill_time), "min").get(),
+            to_default_speed(attributes.flight_speed, "km", "hr"),
+            to_default_duration(attributes.fuel_refill_time, "min"),
             attributes.id_no,
             starting_at_base,
             initial_fuel,
             attributes.pct_fuel_cutoff,
         )
-        self.range_empty: float = Distance(int(attributes.range_empty), "km").get()
-        self.range_under_load: float = Distance(int(attributes.range_under_load), "km").get()
-        self.water_refill_time: float = Duration(int(attributes.water_refill_time), "min").get()
-        self.suppression_time: float = Duration(int(attributes.suppression_time), "min").get()
-        self.water_per_suppression: float = Volume(int(attributes.water_per_suppression), "L").get()
-        self.water_capacity: float = Volume(int(attributes.water_capacity), "L").get()
-        self.water_on_board: float = Volume(int(attributes.water_capacity), "L").get()
-        self.type: str = attributes.bomber_type
-        self.name: str = f"{attributes.bomber_type} {attributes.id_no+1}"
-        self.past_locations = [
-            UpdateEvent(
-                self.name,
-                self.lat,
-                self.lon,
-                self.time,
-                self.status,
-                0,
-                self.current_fuel_capacity,
-                self.get_range(),
-                0,
-                self.water_on_board,
-                [],
-            )
-        ]
+        self.range_empty: float = to_default_distance(attributes.range_empty, "km")
+        self.range_under_load: float = to_default_distance(attributes.range_under_load, "km")
+        self.water_refill_time: float = to_default_duration(attributes.water_refill_time, "min")
+        self.suppression_time: float = to_default_duration(attributes.suppression_time, "min")
+        self.water_per_suppression: float = to_default_volume(attributes.water_per_suppression, "L")
+        self.water_capacity: float = to_default_volume(attributes.water_capacity, "L")
+        self._range_per_water: float = (self.range_under_load - self.range_empty) / (
+            self.water_capacity
+        )
+        self._water_on_board: float = 0.0
+        self._range: float = 0.0
+        self.water_on_board = to_default_volume(attributes.water_capacity, "L")
+        self.type: str = sys.intern(attributes.bomber_type)
+        self.name: str = sys.intern(f"{attributes.bomber_type} {attributes.id_no+1}")
+        self.past_locations = PastLocations(
+            [
+                UpdateEvent(
+                    self.name,
+                    self.lat,
+                    self.lon,
+                    self.time,
+                    self.status,
+                    0,
+                    self.current_fuel_capacity,
+                    self.get_range(),
+                    0,
+                    self.water_on_board,
+                    [],
+                )
+            ]
+        )
+        self._water_tank_cache: Optional[
+            Tuple[
+                List[WaterTank],
+                List[Base],
+                npt.NDArray[np.float64],
+                npt.NDArray[np.float64],
+                npt.NDArray[np.int64],
+            ]
+        ] = None
 
     @classmethod
     def aircraft_type(cls) -> AircraftType:
@@ -94,13 +175,22 @@ class WaterBomber(Aircraft):
         Args:
             other ("WaterBomber"): other
         """
-        self.__dict__.update(other.__dict__)
+        self.copy_from_aircraft(other)
+
+    @property
+    def water_on_board(self) -> float:
+        """Water on board of the water bomber."""
+        return self._water_on_board
+
+    @water_on_board.setter
+    def water_on_board(self, water: float) -> None:
+        """Set water on board, updating the range (which varies linearly with the water)."""
+        self._water_on_board = water
+        self._range = self._range_per_water * water + self.range_empty
 
     def get_range(self) -> float:
         """Return range of Water bomber."""
-        return (self.range_under_load - self.range_empty) * (
-            self.water_on_board / self.water_capacity
-        ) + self.range_empty
+        return self._range
 
     def _get_time_at_strike(self) -> float:
         """Return suppression time of water bomber."""
@@ -108,7 +198,7 @@ class WaterBomber(Aircraft):
 
     def get_name(self) -> str:
         """Return name of Water Bomber."""
-        return str(self.name)
+        return self.name
 
     def get_type(self) -> str:
         """Return type of Water Bomber."""
@@ -126,6 +216,19 @@ class WaterBomber(Aircraft):
             >= self.water_capacity - self._get_future_water()
         )
 
+    def check_water_tanks(self, water_tanks: List[WaterTank]) -> npt.NDArray[np.bool_]:
+        """Return which of the given water tanks pass check_water_tank.
+
+        The water needed is only evaluated once for the batch of water tanks.
+        """
+        future_capacity = not self.use_current_status
+        capacities = np.fromiter(
+            (water_tank.get_water_capacity(future_capacity) for water_tank in water_tanks),
+            float,
+            count=len(water_tanks),
+        )
+        return capacities >= self.water_capacity - self._get_future_water()
+
     def enough_water(
         self, positions: List[Location], state: Optional[Union[Event, str]] = None
     ) -> bool:
@@ -140,55 +243,67 @@ class WaterBomber(Aircraft):
         else:
             water = state.water
         for position in positions:
-            if isinstance(position, Lightning):
+            if position.position_kind == STRIKE_POSITION:
                 water -= self.water_per_suppression
             if water < 0:
                 return False
-            if isinstance(position, WaterTank):
+            if position.position_kind == WATER_TANK_POSITION:
                 water = self.water_capacity
         return True
 
-    def _get_water_refill_time(self) -> float:
-        """Return water refill time of Aircraft. Should be 0 if does not exist."""
-        return self.water_refill_time
-
-    def _get_water_on_board(self) -> float:
-        """Return water refill time of Aircraft. Should be 0 if does not exist."""
-        return self.water_on_board
-
-    def _get_water_per_suppression(self) -> float:
-        """Return water per delivery time of Aircraft."""
-        return self.water_per_suppression
-
-    def _get_water_capacity(self) -> float:
-        """Return water capacity of Aircraft."""
-        return self.water_capacity
-
     def _set_water_on_board(self, water: float) -> None:
         """Set water on board of Aircraft."""
         self.water_on_board = water
 
+    def _water_tank_arrays(
+        self, water_tanks: List[WaterTank], bases: List[Base]
+    ) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.float64], npt.NDArray[np.int64]]:
+        """Return water tank latitudes, longitudes and the index of the closest base to each tank.
+
+        Water tanks and bases do not move, so the arrays are cached for the given lists.
+        """
+        cache = self._water_tank_cache
+        if cache is None or cache[0] is not water_tanks or cache[1] is not bases:
+            tank_lats, tank_lons = location_arrays(water_tanks)
+            base_lats, base_lons = location_arrays(bases)
+            closest_base = np.argmin(
+                haversine(tank_lats[:, np.newaxis], tank_lons[:, np.newaxis], base_lats, base_lons),
+                axis=1,
+            )
+            cache = (water_tanks, bases, tank_lats, tank_lons, closest_base)
+            self._water_tank_cache = cache
+        return cache[2], cache[3], cache[4]
+
     def go_to_water_if_necessary(self, water_tanks: List[WaterTank], bases: List[Base]) -> None:
         """Aircraft will fill up water if it does not have enough to suppress another strike.
 
+        The closest water tank with enough water that the aircraft can reach (and still make it
+        to a base afterwards) is chosen.
+
         Args:
             water_tanks (List[WaterTank]): list of water tanks
             bases (List[Base]): list of avaliable bases
         """
         if self._get_future_water() < self.water_per_suppression:
-            min_dist = inf
             best_tank = None
-            for tank in water_tanks:
-                if self.check_water_tank(tank):
-                    base_index = int(np.argmin(list(map(tank.distance, bases))))
-                    if self.enough_fuel([tank, bases[base_index]]) is not None:
-                        dist_to_tank = self._get_future_position().distance(tank)
-                        if dist_to_tank < min_dist:
-                            min_dist = dist_to_tank
-                            best_tank = tank
+            if water_tanks:
+                tank_lats, tank_lons, closest_base = self._water_tank_arrays(water_tanks, bases)
+                has_water = self.check_water_tanks(water_tanks)
+                future_position = self._get_future_position()
+                dists_to_tanks = haversine(
+                    future_position.lat, future_position.lon, tank_lats, tank_lons
+                )
+                for tank_index in np.argsort(dists_to_tanks, kind="stable"):
+                    tank = water_tanks[tank_index]
+                    if (
+                        has_water[tank_index]
+                        and self.enough_fuel([tank, bases[closest_base[tank_index]]]) is not None
+                    ):
+                        best_tank = tank
+                        break
             if best_tank is None:
                 # If we can't get to water and fuel go staight to fule - no point hovering anymore
-                base_index = int(np.argmin(list(map(self._get_future_position().distance, bases))))
+                base_index = closest_location_index(self._get_future_position(), bases)
                 self.add_location_to_queue(bases[base_index])
             else:
                 self.add_location_to_queue(best_tank)
@@ -1,16 +1,43 @@
 """Aircraft testing."""
 
-from pathlib import Path
-from typing import List
+import pickle
+import random
+from dataclasses import FrozenInstanceError
+from math import inf
+from typing import List, Optional, Tuple, Union
 
+import numpy as np
+import numpy.typing as npt
 import pytest
 
-from bushfire_drone_simulation.aircraft import EPSILON, Status
+from bushfire_drone_simulation.aircraft import EPSILON, Aircraft, PastLocations, Status
+from bushfire_drone_simulation.fire_utils import Base, Location, WaterTank, haversine
 from bushfire_drone_simulation.simulator import Simulator
-from bushfire_drone_simulation.water_bomber import WaterBomber
+from bushfire_drone_simulation.uav import UAVAttributes
+from bushfire_drone_simulation.water_bomber import WaterBomber, WBAttributes
 
-FILE_LOC = Path(__file__)
-PARAMS_LOC = FILE_LOC.parent / "parameters.json"
+WAITING_AT_BASE_CODE = PastLocations.status_code(Status.WAITING_AT_BASE)
+REFUELING_AT_BASE_CODE = PastLocations.status_code(Status.REFUELING_AT_BASE)
+HOVERING_CODE = PastLocations.status_code(Status.HOVERING)
+WAITING_AT_WATER_CODE = PastLocations.status_code(Status.WAITING_AT_WATER)
+GOING_TO_WATER_CODE = PastLocations.status_code(Status.GOING_TO_WATER)
+PREV_WAITING_AT_BASE_CODES = [REFUELING_AT_BASE_CODE, WAITING_AT_BASE_CODE]
+
+
+def update_arrays(
+    aircraft: Aircraft,
+) -> Tuple[npt.NDArray[np.float64], npt.NDArray[np.int8], npt.NDArray[np.int8]]:
+    """Return arrays describing the updates of an aircraft.
+
+    Args:
+        aircraft (Aircraft): aircraft whose past locations are described
+
+    Returns:
+        Tuple: the time of every update, then the status code of each update after the first
+        and the status code of the update before it
+    """
+    status_codes = aircraft.past_locations.status_codes
+    return aircraft.past_locations.times, status_codes[1:], status_codes[:-1]
 
 
 @pytest.mark.slow
@@ -18,10 +45,10 @@ def test_times_chronological(simulations: List[Simulator]) -> None:
     """Are the Aircrafts movements chronological."""
     for simulator in simulations:
         for aircraft in [*simulator.uavs, *simulator.water_bombers]:
-            for idx, update in enumerate(aircraft.past_locations[1:]):
-                assert (
-                    update.time >= aircraft.past_locations[idx].time
-                ), f"The event updates of {aircraft.get_name()} were not in chronological order"
+            times, _, _ = update_arrays(aircraft)
+            assert np.all(
+                np.diff(times) >= 0
+            ), f"The event updates of {aircraft.get_name()} were not in chronological order"
 
 
 @pytest.mark.slow
@@ -29,45 +56,41 @@ def test_reasonable_fuel_refill(simulations: List[Simulator]) -> None:
     """Does the Aircraft refill often enough."""
     for simulator in simulations:
         for aircraft in [*simulator.uavs, *simulator.water_bombers]:
-            time_full = aircraft.past_locations[0].time
-            for idx, update in enumerate(aircraft.past_locations[1:]):
-                if aircraft.past_locations[idx - 1].status == Status.WAITING_AT_BASE:
-                    assert (
-                        update.time - time_full
-                    ) - 1 <= aircraft.get_range() / aircraft.flight_speed, (
-                        f"{aircraft.get_name()} should have run out of fuel"
-                    )
-                    time_full = update.time
+            max_flight_time = aircraft.get_range() / aircraft.flight_speed
+            times, _, prev_statuses = update_arrays(aircraft)
+            # The aircraft is full again at each update following a wait at base
+            refuel_times = times[1:][prev_statuses == WAITING_AT_BASE_CODE]
+            full_times = np.concatenate((times[:1], refuel_times[:-1]))
+            assert np.all(
+                (refuel_times - full_times) - 1 <= max_flight_time
+            ), f"{aircraft.get_name()} should have run out of fuel"
 
 
 @pytest.mark.slow
-def test_aircraft_status(
-    simulations: List[Simulator],
-) -> None:  # pylint: disable=too-many-branches
+def test_aircraft_status(simulations: List[Simulator]) -> None:
     """Does the aircraft status alter reasonably."""
-    for simulator in simulations:  # pylint: disable=too-many-nested-blocks
+    for simulator in simulations:
         for aircraft in [*simulator.uavs, *simulator.water_bombers]:
-            for idx, update in enumerate(aircraft.past_locations[1:]):
-                if update.status == Status.WAITING_AT_BASE:
-                    assert (
-                        aircraft.past_locations[idx - 1].status == Status.GOING_TO_BASE
-                        or Status.WAITING_AT_BASE
-                    ), f"{aircraft.get_name()} should have previously been going to base"
-                if update.status == Status.HOVERING:
-                    assert (
-                        aircraft.past_locations[idx - 1].status != Status.WAITING_AT_BASE
-                    ), f"{aircraft.get_name()} should have previously been going to strike"
-                if update.status == Status.WAITING_AT_WATER:
-                    assert isinstance(
-                        aircraft, WaterBomber
-                    ), f"{aircraft.get_name()} should not be waiting at water"
-                    assert aircraft.past_locations[idx - 1].status in [
-                        Status.GOING_TO_WATER,
-                        Status.WAITING_AT_WATER,
-                    ], f"{aircraft.name} should have previously been going to water"
-                assert (
-                    isinstance(aircraft, WaterBomber) or update.status != Status.GOING_TO_WATER
+            _, statuses, prev_statuses = update_arrays(aircraft)
+            assert np.all(
+                np.isin(prev_statuses[statuses == WAITING_AT_BASE_CODE], PREV_WAITING_AT_BASE_CODES)
+            ), f"{aircraft.get_name()} should have previously been refueling at base"
+            assert np.all(
+                prev_statuses[statuses == HOVERING_CODE] != WAITING_AT_BASE_CODE
+            ), f"{aircraft.get_name()} should have previously been going to strike"
+            if not isinstance(aircraft, WaterBomber):
+                assert not np.any(
+                    statuses == WAITING_AT_WATER_CODE
+                ), f"{aircraft.get_name()} should not be waiting at water"
+                assert not np.any(
+                    statuses == GOING_TO_WATER_CODE
                 ), f"{aircraft.get_name()} should not be waiting at or going to water"
+            assert np.all(
+                np.isin(
+                    prev_statuses[statuses == WAITING_AT_WATER_CODE],
+                    [GOING_TO_WATER_CODE, WAITING_AT_WATER_CODE],
+                )
+            ), f"{aircraft.get_name()} should have previously been going to water"
 
 
 @pytest.mark.slow
@@ -75,10 +98,109 @@ def test_aircraft_speed(simulations: List[Simulator]) -> None:
     """Does the Aircraft ever exceed it's flight speed."""
     for simulator in simulations:
         for aircraft in [*simulator.uavs, *simulator.water_bombers]:
-            for idx, update in enumerate(aircraft.past_locations[1:]):
-                prev_update = aircraft.past_locations[idx - 1]
-                distance = update.distance(prev_update)
-                time = update.time - prev_update.time
-                assert (
-                    aircraft.flight_speed + EPSILON >= distance / time
-                ), f"{aircraft.get_name()} exceeded flight speed"
+            lats = aircraft.past_locations.lats
+            lons = aircraft.past_locations.lons
+            distances = haversine(lats[:-1], lons[:-1], lats[1:], lons[1:])
+            times = np.diff(aircraft.past_locations.times)
+            instantaneous = times == 0
+            assert np.all(
+                distances[instantaneous] <= EPSILON
+            ), f"{aircraft.get_name()} moved instantaneously"
+            assert np.all(
+                aircraft.flight_speed + EPSILON >= distances[~instantaneous] / times[~instantaneous]
+            ), f"{aircraft.get_name()} exceeded flight speed"
+
+
+def closest_reachable_water_tank(
+    water_bomber: WaterBomber, water_tanks: List[WaterTank], bases: List[Base]
+) -> Optional[WaterTank]:
+    """Find the water tank go_to_water_if_necessary should choose by checking every tank."""
+    min_dist = inf
+    best_tank = None
+    for tank in water_tanks:
+        if water_bomber.check_water_tank(tank):
+            closest_base = min(bases, key=tank.distance)
+            if water_bomber.enough_fuel([tank, closest_base]) is not None:
+                dist_to_tank = Location(water_bomber.lat, water_bomber.lon).distance(tank)
+                if dist_to_tank < min_dist:
+                    min_dist = dist_to_tank
+                    best_tank = tank
+    return best_tank
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize("seed", range(20))
+def test_go_to_water_if_necessary(seed: int) -> None:
+    """Does the water bomber go to the closest reachable water tank with enough water."""
+    rand = random.Random(seed)
+    water_tanks = [
+        WaterTank(rand.uniform(-37, -35), rand.uniform(148, 150), rand.choice([0, 5000, 20000]), i)
+        for i in range(30)
+    ]
+    bases = [Base(rand.uniform(-37, -35), rand.uniform(148, 150), i) for i in range(5)]
+    water_bomber = WaterBomber(
+        WBAttributes(
+            id_no=0,
+            latitude=rand.uniform(-37, -35),
+            longitude=rand.uniform(148, 150),
+            flight_speed=235,
+            fuel_refill_time=30,
+            suppression_time=1,
+            water_refill_time=30,
+            water_per_suppression=2875,
+            range_empty=300,
+            range_under_load=300,
+            water_capacity=11500,
+            pct_fuel_cutoff=0.7,
+            bomber_type="helicopter",
+        ),
+        starting_at_base=False,
+        initial_fuel=rand.uniform(0.1, 1),
+    )
+    water_bomber.water_on_board = 0
+    expected_tank = closest_reachable_water_tank(water_bomber, water_tanks, bases)
+    water_bomber.go_to_water_if_necessary(water_tanks, bases)
+    destination = water_bomber.event_queue.peak().position
+    if expected_tank is None:
+        assert isinstance(destination, Base), "Water bomber should have gone to a base"
+    else:
+        assert destination is expected_tank, "Water bomber went to the wrong water tank"
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize(
+    "attributes",
+    [
+        UAVAttributes(
+            id_no=0,
+            latitude=-36.0,
+            longitude=149.0,
+            flight_speed=150,
+            fuel_refill_time=30,
+            range=450,
+            inspection_time=1,
+            pct_fuel_cutoff=0.25,
+        ),
+        WBAttributes(
+            id_no=0,
+            latitude=-36.0,
+            longitude=149.0,
+            flight_speed=235,
+            fuel_refill_time=30,
+            suppression_time=1,
+            water_refill_time=30,
+            water_per_suppression=2875,
+            range_empty=300,
+            range_under_load=300,
+            water_capacity=11500,
+            pct_fuel_cutoff=0.7,
+            bomber_type="helicopter",
+        ),
+    ],
+)
+def test_attributes_pickle(attributes: Union[UAVAttributes, WBAttributes]) -> None:
+    """Do the frozen aircraft attributes survive a pickle round trip and stay frozen."""
+    unpickled = pickle.loads(pickle.dumps(attributes))
+    assert unpickled == attributes, "Aircraft attributes changed when pickled"
+    with pytest.raises(FrozenInstanceError):
+        unpickled.id_no = 1  # type: ignore
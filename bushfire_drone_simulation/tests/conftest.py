@@ -29,7 +29,7 @@ def fixture_simulations_list(
     return to_return
 
 
-@pytest.fixture(name="simulations")
+@pytest.fixture(name="simulations", scope="session")
 def fixture_simulations(
     simulations_list: List[Tuple[List[Simulator], JSONParameters]]
 ) -> List[Simulator]:
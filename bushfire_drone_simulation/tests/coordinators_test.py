@@ -3,18 +3,18 @@
 Compares meaningful attributes of coordinators
 """
 
-from pathlib import Path
-from statistics import mean
-from typing import List, Optional, Tuple
+from functools import lru_cache
+from typing import Dict, List, Tuple
 
+import numpy as np
+import numpy.typing as npt
 import pytest
 
-from bushfire_drone_simulation.fire_utils import Time
 from bushfire_drone_simulation.parameters import JSONParameters
 from bushfire_drone_simulation.simulator import Simulator
+from bushfire_drone_simulation.units import to_default_duration
 
-FILE_LOC = Path(__file__)
-PARAMS_LOC = FILE_LOC.parent / "parameters.json"
+HOUR = to_default_duration(1, "hr")
 
 
 @pytest.mark.slow
@@ -23,25 +23,14 @@ def test_coordinator_properties(
 ) -> None:
     """Does the Minimise Mean Time coordinator have the lowest mean time."""
     for simulators, params in simulations_list:
-        reprocess_max_time_simulation: Optional[Simulator] = None
-        minimise_mean_time_simulation: Optional[Simulator] = None
-        simple_simulation: Optional[Simulator] = None
-        insertion_simulation: Optional[Simulator] = None
-        for scenario_idx in range(len(params.scenarios)):
-            if (
-                str(params.get_attribute("scenario_name", scenario_idx))
-                == "ReprocessMaxTimeCoordinator"
-            ):
-                reprocess_max_time_simulation = simulators[scenario_idx]
-            if (
-                str(params.get_attribute("scenario_name", scenario_idx))
-                == "MinimiseMeanTimeCoordinator"
-            ):
-                minimise_mean_time_simulation = simulators[scenario_idx]
-            if str(params.get_attribute("scenario_name", scenario_idx)) == "SimpleCoordinator":
-                simple_simulation = simulators[scenario_idx]
-            if str(params.get_attribute("scenario_name", scenario_idx)) == "InsertionCoordinator":
-                insertion_simulation = simulators[scenario_idx]
+        simulations_by_name: Dict[str, Simulator] = {
+            str(params.get_attribute("scenario_name", scenario_idx)): simulators[scenario_idx]
+            for scenario_idx in range(len(params.scenarios))
+        }
+        reprocess_max_time_simulation = simulations_by_name.get("ReprocessMaxTimeCoordinator")
+        minimise_mean_time_simulation = simulations_by_name.get("MinimiseMeanTimeCoordinator")
+        simple_simulation = simulations_by_name.get("SimpleCoordinator")
+        insertion_simulation = simulations_by_name.get("InsertionCoordinator")
         assert (
             reprocess_max_time_simulation is not None
         ), "Not testing Reprocess Max Time coordinator"
@@ -50,36 +39,45 @@ def test_coordinator_properties(
         ), "Not testing Minimise Mean Time coordinator"
         assert simple_simulation is not None, "Not testing Simple Time coordinator"
         assert insertion_simulation is not None, "Not testing Insertion Time coordinator"
-        assert mean(get_inspection_times(minimise_mean_time_simulation)) >= mean(
-            get_inspection_times(reprocess_max_time_simulation)
+        minimise_inspection_times = get_inspection_times(minimise_mean_time_simulation)
+        minimise_suppression_times = get_supression_times(minimise_mean_time_simulation)
+        minimise_mean_inspection_time = minimise_inspection_times.mean()
+        minimise_mean_suppression_time = minimise_suppression_times.mean()
+        assert (
+            minimise_mean_inspection_time
+            >= get_inspection_times(reprocess_max_time_simulation).mean()
         ), "Minimise mean time returned a higher mean inspection time than Reprocess max time"
-        assert mean(get_inspection_times(minimise_mean_time_simulation)) >= mean(
-            get_inspection_times(insertion_simulation)
+        assert (
+            minimise_mean_inspection_time >= get_inspection_times(insertion_simulation).mean()
         ), "Minimise mean time returned a higher mean inspection time than Insertion"
-        assert mean(get_inspection_times(minimise_mean_time_simulation)) >= mean(
-            get_inspection_times(simple_simulation)
+        assert (
+            minimise_mean_inspection_time >= get_inspection_times(simple_simulation).mean()
         ), "Minimise mean time returned a higher mean inspection time than Simple"
-        assert max(get_inspection_times(minimise_mean_time_simulation)) <= max(
-            get_inspection_times(reprocess_max_time_simulation)
+        assert (
+            minimise_inspection_times.max()
+            <= get_inspection_times(reprocess_max_time_simulation).max()
         ), "Reprocess max time returned a higher maximum inspection time than Minimise mean time"
-        assert mean(get_supression_times(minimise_mean_time_simulation)) >= mean(
-            get_supression_times(reprocess_max_time_simulation)
+        assert (
+            minimise_mean_suppression_time
+            >= get_supression_times(reprocess_max_time_simulation).mean()
         ), "Minimise mean time returned a higher mean supression time than Reprocess max time"
-        assert mean(get_supression_times(minimise_mean_time_simulation)) >= mean(
-            get_supression_times(insertion_simulation)
+        assert (
+            minimise_mean_suppression_time >= get_supression_times(insertion_simulation).mean()
         ), "Minimise mean time returned a higher mean supression time than Insertion"
-        assert mean(get_supression_times(minimise_mean_time_simulation)) >= mean(
-            get_supression_times(simple_simulation)
+        assert (
+            minimise_mean_suppression_time >= get_supression_times(simple_simulation).mean()
         ), "Minimise mean time returned a higher mean supression time than Simple"
-        assert max(get_supression_times(minimise_mean_time_simulation)) <= max(
-            get_supression_times(reprocess_max_time_simulation)
+        assert (
+            minimise_suppression_times.max()
+            <= get_supression_times(reprocess_max_time_simulation).max()
         ), "Reprocess max time returned a higher max supression time than Minimise mean time"
 
 
+@lru_cache(maxsize=None)
 def get_inspection_times(
     simulation: Simulator,
-) -> List[float]:
-    """Return list of inspection times of lightning strikes.
+) -> npt.NDArray[np.float64]:
+    """Return array of inspection times of lightning strikes.
 
     Confirms that each strike was inspected.
 
@@ -87,21 +85,20 @@ def get_inspection_times(
         simulation (Simulation): simulation that lightning strikes occured in
 
     Returns:
-        List[float]: list of inspection times
+        npt.NDArray[np.float64]: array of inspection times
     """
     inspection_times: List[float] = []
     for strike in simulation.lightning_strikes:
         assert strike.inspected_time is not None, f"Lightning strike {strike} was not inspected"
-        inspection_times.append(
-            Time.from_float(strike.inspected_time - strike.spawn_time).get("hr"),
-        )
-    return inspection_times
+        inspection_times.append(strike.inspected_time - strike.spawn_time)
+    return np.array(inspection_times) / HOUR
 
 
+@lru_cache(maxsize=None)
 def get_supression_times(
     simulation: Simulator,
-) -> List[float]:
-    """Return list of supression times of lightning strikes.
+) -> npt.NDArray[np.float64]:
+    """Return array of supression times of lightning strikes.
 
     Confirms that all ignighted strikes were supressed.
 
@@ -109,7 +106,7 @@ def get_supression_times(
         simulation (Simulation): simulation that lightning strikes occured in
 
     Returns:
-        List[float]: list of supression times
+        npt.NDArray[np.float64]: array of supression times
     """
     suppression_times: List[float] = []
     for strike in simulation.lightning_strikes:
@@ -117,7 +114,5 @@ def get_supression_times(
             assert (
                 strike.suppressed_time is not None
             ), f"Lightning strike {strike} ignighted but was not supressed"
-            suppression_times.append(
-                Time.from_float(strike.suppressed_time - strike.spawn_time).get("hr"),
-            )
-    return suppression_times
+            suppression_times.append(strike.suppressed_time - strike.spawn_time)
+    return np.array(suppression_times) / HOUR
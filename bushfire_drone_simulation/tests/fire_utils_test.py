@@ -0,0 +1,44 @@
+"""Fire utilities testing."""
+
+import random
+from math import atan2, cos, radians, sin, sqrt
+
+import numpy as np
+import pytest
+
+from bushfire_drone_simulation.fire_utils import Location, haversine
+from bushfire_drone_simulation.kernels import EARTH_RADIUS
+
+
+def python_haversine(lat_1: float, lon_1: float, lat_2: float, lon_2: float) -> float:
+    """Find the great circle distance in km with the plain Python formula."""
+    temp = (
+        sin(radians(lat_2 - lat_1) / 2) ** 2
+        + cos(radians(lat_1)) * cos(radians(lat_2)) * sin(radians(lon_2 - lon_1) / 2) ** 2
+    )
+    return EARTH_RADIUS * 2 * atan2(sqrt(temp), sqrt(1 - temp))
+
+
+@pytest.mark.unit
+def test_distance_matches_python_haversine() -> None:
+    """Does the compiled Location.distance agree with the Python haversine formula."""
+    rand = random.Random(0)
+    coordinates = [
+        (
+            rand.uniform(-90, 90),
+            rand.uniform(-180, 180),
+            rand.uniform(-90, 90),
+            rand.uniform(-180, 180),
+        )
+        for _ in range(10000)
+    ]
+    distances = [
+        Location(lat_1, lon_1).distance(Location(lat_2, lon_2))
+        for lat_1, lon_1, lat_2, lon_2 in coordinates
+    ]
+    expected = [python_haversine(*coordinate) for coordinate in coordinates]
+    # The compiled and Python maths libraries may round the last few bits differently
+    assert np.allclose(distances, expected, rtol=1e-15, atol=0), "Location.distance is inaccurate"
+    assert np.allclose(
+        haversine(*np.array(coordinates).T), expected, rtol=1e-15, atol=0
+    ), "Vectorised haversine is inaccurate"
@@ -1,123 +1,251 @@
 """TODO Docstring."""
 
-import glob
+import hashlib
 import logging
 import os
+import shlex
+import shutil
 import subprocess
+import tempfile
+import time
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Iterator, List
 
 import typer
-from livereload import Server, shell
+from livereload import Server
 
 _LOG = logging.getLogger(__name__)
 app = typer.Typer()
 
+SCRIPT_DIR = Path(__file__).resolve().parent
+REPO_ROOT = SCRIPT_DIR.parent
+DOCS_DIR = REPO_ROOT / "docs"
+
+# A page per module so that editing one module only makes sphinx re-read that page
+_APIDOC_OPTIONS = ("-f", "--separate")
+
+
+def _iter_python_files(folder: Path) -> Iterator[Path]:
+    """Yield every python file under folder, using the directory entries to avoid extra stats."""
+    with os.scandir(folder) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _iter_python_files(Path(entry.path))
+            elif entry.name.endswith(".py"):
+                yield Path(entry.path)
+
+
+def _write_if_changed(path: Path, text: str) -> None:
+    """Write text to path unless it already holds it, so sphinx does not see it as modified."""
+    if not path.exists() or path.read_text(encoding="utf8") != text:
+        path.write_text(text, encoding="utf8")
+
+
+def _run_apidoc(source_folder: Path, output_folder: Path) -> str:
+    """Run sphinx-apidoc on a source folder, only writing out the files whose contents changed.
+
+    Returns:
+        str: the generated modules.rst, which is left for the caller to write
+    """
+    output_folder.mkdir(parents=True, exist_ok=True)
+    with tempfile.TemporaryDirectory() as apidoc_folder:
+        subprocess.run(
+            ["sphinx-apidoc", *_APIDOC_OPTIONS, "-o", apidoc_folder, str(source_folder)],
+            check=True,
+        )
+        for generated in Path(apidoc_folder).iterdir():
+            if generated.name != "modules.rst":
+                _write_if_changed(output_folder / generated.name, generated.read_text("utf8"))
+        return (Path(apidoc_folder) / "modules.rst").read_text("utf8")
+
+
+def _build_app_docs(application: str) -> None:
+    """Generate the sphinx source for an application's modules."""
+    source_folder = REPO_ROOT / application / "src" / application
+    output_folder = DOCS_DIR / "source" / "auto_generated" / "application" / application
+    files = sorted(_iter_python_files(source_folder))
+    with open(REPO_ROOT / application / "README.rst", encoding="utf8") as readme:
+        readme_text = readme.read()
+
+    # The generated rst only depends on which modules exist, the readme and the apidoc options,
+    # so skip regenerating it (and invalidating sphinx's cache) if none of them have changed
+    modules_hash = hashlib.md5(
+        "\0".join(
+            [
+                *_APIDOC_OPTIONS,
+                *(file.relative_to(REPO_ROOT).as_posix() for file in files),
+                readme_text,
+            ]
+        ).encode("utf8")
+    ).hexdigest()
+    hash_file = output_folder / ".modules_hash"
+    if hash_file.exists():
+        with open(hash_file, encoding="utf8") as previous_hash:
+            if previous_hash.read() == modules_hash:
+                _LOG.info("Modules of %s unchanged, skipping sphinx-apidoc", application)
+                return
+
+    # Generate sphinx auto documentation
+    modules_text = _run_apidoc(source_folder, output_folder).replace("=", "-")
+
+    # Generate class inheritance trees
+    module_names = (
+        ".".join((application, *module_file.relative_to(source_folder).with_suffix("").parts))
+        for module_file in files
+    )
+    display_files = " ".join(module for module in module_names if not module.endswith("_"))
+
+    # Move readme into sphinx docs ahead of the module list and inheritance trees
+    _write_if_changed(
+        output_folder / "modules.rst",
+        "".join(
+            [
+                readme_text,
+                "\n\n",
+                modules_text,
+                "\n\nClasses\n-------\n",
+                f".. inheritance-diagram:: {display_files}\n",
+                "  :parts: 1\n\n",
+            ]
+        ),
+    )
+
+    with open(hash_file, "w", encoding="utf8") as new_hash:
+        new_hash.write(modules_hash)
+
+
+def _build_tools_docs() -> None:
+    """Generate the sphinx source for the tools if one of them is newer than its last output."""
+    tools_output = DOCS_DIR / "source/auto_generated/documenting/documentation_server"
+    # Unchanged output is not rewritten, so record when the tools were last documented separately
+    # (with the rest of the build state rather than in the source tree)
+    stamp_file = DOCS_DIR / "build" / ".tools_apidoc_stamp"
+    newest_tool = max(tool.stat().st_mtime for tool in _iter_python_files(SCRIPT_DIR))
+    if not stamp_file.exists() or newest_tool > stamp_file.stat().st_mtime:
+        modules_text = _run_apidoc(SCRIPT_DIR, tools_output)
+        _write_if_changed(tools_output / "modules.rst", modules_text)
+        stamp_file.parent.mkdir(parents=True, exist_ok=True)
+        stamp_file.touch()
+    else:
+        _LOG.info("Tools unchanged, skipping sphinx-apidoc")
+
+
+def _is_generated_doc_source(path: str) -> bool:
+    """Return whether path is generated, static or template content in the docs source folder."""
+    top_level = os.path.relpath(path, DOCS_DIR / "source").split(os.sep)[0]
+    return top_level != ".." and (top_level.startswith("_") or top_level == "auto_generated")
+
+
+def _newest_mtime(paths: List[Path]) -> float:
+    """Return the newest modification time of the given watched folders and their contents."""
+    newest = 0.0
+    for path in paths:
+        newest = max(newest, path.stat().st_mtime)
+        for root, dirs, files in os.walk(path):
+            # Python writes bytecode while sphinx imports the modules, which is not a change
+            dirs[:] = [
+                folder
+                for folder in dirs
+                if folder != "__pycache__"
+                and not _is_generated_doc_source(os.path.join(root, folder))
+            ]
+            for name in dirs + [file for file in files if not file.endswith(".pyc")]:
+                if not _is_generated_doc_source(os.path.join(root, name)):
+                    newest = max(newest, os.stat(os.path.join(root, name)).st_mtime)
+    return newest
+
+
+def _debounced(
+    rebuild: Callable[[], Any], watched: List[Path], wait: float = 0.3
+) -> Callable[[], None]:
+    """Wrap a rebuild so that a burst of changes to the watched paths only triggers it once.
+
+    livereload reports the changed files of a burst (e.g. from a formatter) one at a time, so
+    each rebuild first waits for the burst to settle and is skipped if nothing has changed since
+    the previous rebuild started.
+    """
+    last_start = 0.0
+
+    def run() -> None:
+        nonlocal last_start
+        if _newest_mtime(watched) < last_start:
+            _LOG.info("Changes already included in the last build, skipping rebuild")
+            return
+        last_start = time.time()
+        time.sleep(wait)
+        rebuild()
+
+    return run
+
 
 @app.command()
-def make_documentation() -> None:
-    """Make documentation."""
-    script_location = os.path.dirname(os.path.abspath(__file__))
-    os.chdir(script_location + "/../")
+def make_documentation(clean: bool = False) -> None:
+    """Make documentation, removing the previous build first if clean is set."""
+    build_folder = DOCS_DIR / "build"
+    if clean:
+        shutil.rmtree(build_folder, ignore_errors=True)
+
+    # The tools and each application are independent and mostly wait on sphinx-apidoc, so
+    # generate them all together
+    applications = ["bushfire_drone_simulation"]
+    with ThreadPoolExecutor(max_workers=len(applications) + 1) as executor:
+        builds = [
+            executor.submit(_build_tools_docs),
+            *(executor.submit(_build_app_docs, application) for application in applications),
+        ]
+        for build in builds:
+            build.result()
 
+    # Only cleaned when asked so that sphinx just rebuilds the pages that have changed, and read
+    # and write the pages in parallel (changes to conf.py still need a clean build). Sphinx is
+    # called directly rather than through the Makefile to only run the html builder.
     subprocess.run(
         [
-            "sphinx-apidoc",
-            "-f",
-            "-o",
-            "docs/source/auto_generated/documenting/documentation_server",
-            "tools",
+            "sphinx-build",
+            "-b",
+            "html",
+            "-j",
+            "auto",
+            "-T",
+            "--keep-going",
+            "-d",
+            str(build_folder / "doctrees"),
+            *shlex.split(os.environ.get("SPHINXOPTS", "")),
+            str(DOCS_DIR / "source"),
+            str(build_folder / "html"),
         ],
         check=True,
     )
 
-    applications = ["bushfire_drone_simulation"]
-    for application in applications:
-        # Generate sphinx auto documentation
-        subprocess.run(
-            [
-                "sphinx-apidoc",
-                "-f",
-                "-o",
-                "docs/source/auto_generated/application/" + application,
-                application + "/src/" + application,
-            ],
-            check=True,
-        )
 
-        files = glob.glob(f"{application}/src/{application}/**/*.py", recursive=True)
-        previous_text = ""
-        with open(
-            f"docs/source/auto_generated/application/{application}/modules.rst",
-            "r",
-            encoding="utf8",
-        ) as application_rst:
-            previous_text = application_rst.read().replace("=", "-")
-
-        with open(
-            f"docs/source/auto_generated/application/{application}/modules.rst",
-            "w",
-            encoding="utf8",
-        ) as application_rst:
-            # Move readme into sphinx docs
-            with open(f"{application}/README.rst", encoding="utf8") as readme:
-                application_rst.write(readme.read())
-
-            application_rst.write("\n\n")
-
-            application_rst.write(previous_text)
-
-            # Generate class inheritance trees
-            application_rst.write("\n\nClasses\n-------\n")
-            display_files = []
-            for module_file in files:
-                module_file = (
-                    module_file.strip("py")
-                    .strip(".")
-                    .replace(f"{application}/src/", "")
-                    .replace("/", ".")
-                    .replace("\\", ".")
-                )
-                if not module_file.endswith("_"):
-                    display_files.append(module_file)
-            application_rst.write(f".. inheritance-diagram:: {' '.join(display_files)}\n")
-            application_rst.write("  :parts: 1\n\n")
-
-    os.chdir(os.getcwd() + "/docs/")
-    if os.name == "nt":  # Running on a windows maching
-        subprocess.run(["make.bat", "clean"], check=True)
-        subprocess.run(["make.bat", "html"], check=True)
-    else:
-        subprocess.run(["make", "clean"], check=True)
-        subprocess.run(["make", "html"], check=True)
-    os.chdir(script_location + "/../")
+def _rebuild_documentation() -> None:
+    """Rebuild the documentation in this process, logging rather than raising failures."""
+    try:
+        make_documentation()
+    except subprocess.CalledProcessError as error:
+        _LOG.error("Failed to rebuild documentation: %s", error)
 
 
 @app.command()
 def start_server(host: str = "localhost", port: str = "8000", live: bool = False) -> None:
     """Start server for documentation."""
-    make_documentation()
+    # Start from a clean build, then let the live rebuilds be incremental
+    make_documentation(clean=True)
     server = Server()
     if live:
-        for filename in os.listdir("docs/source"):
-            if not filename.startswith("_") and filename != "auto_generated":
-                server.watch(
-                    os.getcwd() + f"/docs/source/{filename}",
-                    shell("python tools/doc_server.py make-documentation"),
-                )
-        server.watch(
-            os.getcwd() + "/bushfire_drone_simulation",
-            shell("python tools/doc_server.py make-documentation"),
-        )
-        server.watch(os.getcwd() + "/tools", shell("python tools/doc_server.py make-documentation"))
-    server.serve(root="docs/build/html", host=host, port=port)
+        watched = [DOCS_DIR / "source", REPO_ROOT / "bushfire_drone_simulation", SCRIPT_DIR]
+        rebuild = _debounced(_rebuild_documentation, watched)
+        for path in watched:
+            server.watch(str(path), rebuild, ignore=_is_generated_doc_source)
+    server.serve(root=str(DOCS_DIR / "build" / "html"), host=host, port=port)
 
 
 @app.command()
 def make_pdf() -> None:
     """Make a pdf version of the documentation."""
-    script_location = os.path.dirname(os.path.abspath(__file__))
     make_documentation()
-    os.chdir(os.getcwd() + "/docs/")
-    subprocess.run(["make", "latexpdf"], check=True)
+    subprocess.run(["make", "latexpdf"], check=True, cwd=DOCS_DIR)
     subprocess.run(
         [
             "cp",
@@ -125,8 +253,8 @@ def make_pdf() -> None:
             "ANU Bushfire Initiative Drone Simulation Documentation.pdf",
         ],
         check=True,
+        cwd=DOCS_DIR,
     )
-    os.chdir(script_location + "/../")
 
 
 if __name__ == "__main__":